@@ -1,6 +1,7 @@
 # Generic Agent Registry for Multi-Agent Systems
 # Database-driven agent loading via version factory
 
+from contextvars import ContextVar
 from typing import Any
 
 from agno.agent import Agent
@@ -11,6 +12,9 @@ from lib.mcp.catalog import MCPCatalog
 from lib.utils.ai_root import AIRootError, resolve_ai_root
 from lib.utils.version_factory import create_agent
 
+# Agent IDs found by an in-flight get_all_agents() call, reused by its per-agent lookups
+_discovery_snapshot: ContextVar[list[str] | None] = ContextVar("agent_discovery_snapshot", default=None)
+
 
 def _discover_agents() -> list[str]:
     """Dynamically discover available agents from filesystem"""
@@ -92,6 +96,9 @@ class AgentRegistry:
     @classmethod
     def _get_available_agents(cls) -> list[str]:
         """Get all available agent IDs"""
+        snapshot = _discovery_snapshot.get()
+        if snapshot is not None:
+            return snapshot
         return _discover_agents()
 
     @classmethod
@@ -160,18 +167,23 @@ class AgentRegistry:
         agents = {}
         available_agents = cls._get_available_agents()
 
-        for agent_id in available_agents:
-            try:
-                agents[agent_id] = await cls.get_agent(
-                    agent_id=agent_id,
-                    session_id=session_id,
-                    debug_mode=debug_mode,
-                    db_url=db_url,
-                    memory=memory,
-                )
-            except Exception as e:
-                logger.warning("Failed to load agent", agent_id=agent_id, error=str(e))
-                continue
+        # Each get_agent() validates its ID; reuse this scan instead of re-parsing every config per agent
+        token = _discovery_snapshot.set(available_agents)
+        try:
+            for agent_id in available_agents:
+                try:
+                    agents[agent_id] = await cls.get_agent(
+                        agent_id=agent_id,
+                        session_id=session_id,
+                        debug_mode=debug_mode,
+                        db_url=db_url,
+                        memory=memory,
+                    )
+                except Exception as e:
+                    logger.warning("Failed to load agent", agent_id=agent_id, error=str(e))
+                    continue
+        finally:
+            _discovery_snapshot.reset(token)
 
         return agents
 
@@ -12,6 +12,7 @@ This template demonstrates all key features of Agno Workflows 2.0:
 
 import json
 from datetime import UTC, datetime
+from functools import lru_cache
 
 from agno.agent import Agent
 from agno.workflow import Step, Workflow
@@ -20,11 +21,14 @@ from agno.workflow.types import StepInput, StepOutput
 from lib.config.models import get_default_model_id, resolve_model
 from lib.logging import logger
 
+# Step agents share identical model settings, so reuse one instance (and its provider client) per model ID
+_resolve_model_cached = lru_cache(maxsize=8)(resolve_model)
+
 
 def create_template_model():
     """Create model for template workflow using dynamic resolution"""
 
-    return resolve_model(
+    return _resolve_model_cached(
         model_id=get_default_model_id(),  # Use environment-based default
         temperature=0.7,
         max_tokens=1000,
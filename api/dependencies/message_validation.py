@@ -106,7 +106,8 @@ async def validate_runs_request(request: Request) -> None:
             # Handle JSON data
             body = await request.body()
             if body:
-                data = json.loads(body.decode())
+                # json.loads detects the encoding of raw bytes itself, avoiding a decoded copy of the body
+                data = json.loads(body)
                 message = data.get("message", "")
             else:
                 message = ""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import threading
 from collections.abc import Iterable
 from pathlib import Path
 
@@ -23,6 +24,12 @@ class WishMetadata(BaseModel):
     path: str
 
 
+# Parsed wishes keyed by (path, project root); reused while (st_mtime_ns, st_size) is unchanged
+_WISH_CACHE: dict[tuple[Path, Path], tuple[tuple[int, int], WishMetadata]] = {}
+# get_wish_catalog is a sync dependency run in the threadpool, so concurrent requests share the cache
+_WISH_CACHE_LOCK = threading.Lock()
+
+
 def _discover_wish_files(base_path: Path) -> Iterable[Path]:
     """Yield wish markdown files from the Genie workspace."""
 
@@ -32,28 +39,27 @@ def _discover_wish_files(base_path: Path) -> Iterable[Path]:
     return sorted(base_path.glob("*-wish.md"))
 
 
-def _extract_title(lines: list[str], default: str) -> str:
-    for line in lines:
-        match = TITLE_PATTERN.match(line.strip())
-        if match:
-            return match.group("title").strip()
-    return default
+def _scan_wish_header(path: Path, default_title: str) -> tuple[str, str]:
+    """Return the first title and status lines, reading only as far as both are found."""
 
+    title: str | None = None
+    status: str | None = None
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            stripped = line.strip()
+            if title is None and (match := TITLE_PATTERN.match(stripped)):
+                title = match.group("title").strip()
+            elif status is None and (match := STATUS_PATTERN.match(stripped)):
+                status = match.group("status").strip()
+            if title is not None and status is not None:
+                break
 
-def _extract_status(lines: list[str]) -> str:
-    for line in lines:
-        match = STATUS_PATTERN.match(line.strip())
-        if match:
-            return match.group("status").strip()
-    return "UNKNOWN"
+    return title or default_title, status or "UNKNOWN"
 
 
 def _parse_wish_file(path: Path, project_root: Path) -> WishMetadata:
-    raw_lines = path.read_text(encoding="utf-8").splitlines()
     default_title = path.stem.replace("-", " ").title()
-
-    title = _extract_title(raw_lines, default=default_title)
-    status = _extract_status(raw_lines)
+    title, status = _scan_wish_header(path, default_title)
 
     relative_path = str(path.relative_to(project_root))
 
@@ -65,6 +71,22 @@ def _parse_wish_file(path: Path, project_root: Path) -> WishMetadata:
     )
 
 
+def _load_wish(path: Path, project_root: Path) -> WishMetadata:
+    """Return cached metadata for ``path`` unless the file changed since it was parsed."""
+
+    stat = path.stat()
+    file_key = (stat.st_mtime_ns, stat.st_size)
+    with _WISH_CACHE_LOCK:
+        cached = _WISH_CACHE.get((path, project_root))
+    if cached is not None and cached[0] == file_key:
+        return cached[1]
+
+    metadata = _parse_wish_file(path, project_root)
+    with _WISH_CACHE_LOCK:
+        _WISH_CACHE[(path, project_root)] = (file_key, metadata)
+    return metadata
+
+
 def get_wish_catalog() -> list[WishMetadata]:
     """Load wish metadata for FastAPI dependencies."""
 
@@ -72,7 +94,12 @@ def get_wish_catalog() -> list[WishMetadata]:
     wishes_dir = project_root / "genie" / "wishes"
 
     wish_files = _discover_wish_files(wishes_dir)
-    if not wish_files:
-        return []
+    catalog = [_load_wish(path, project_root) for path in wish_files]
+
+    # Forget wishes that were deleted or renamed since the previous request
+    current = {(path, project_root) for path in wish_files}
+    with _WISH_CACHE_LOCK:
+        for stale in _WISH_CACHE.keys() - current:
+            del _WISH_CACHE[stale]
 
-    return [_parse_wish_file(path, project_root) for path in wish_files]
+    return catalog
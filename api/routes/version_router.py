@@ -5,6 +5,7 @@ Modern versioning endpoints using Agno storage abstractions.
 No backward compatibility - clean implementation only.
 """
 
+import asyncio
 import os
 from typing import TYPE_CHECKING, Any
 
@@ -116,10 +117,12 @@ async def execute_versioned_component(
         cpf=request.cpf,
     )
 
-    # Execute component with validation
+    # Execute component with validation off the event loop - agent.run() blocks for the whole model call
     from lib.utils.message_validation import safe_agent_run
 
-    response = safe_agent_run(component, request.message, f"versioned {component_type} {request.component_id}")
+    response = await asyncio.to_thread(
+        safe_agent_run, component, request.message, f"versioned {component_type} {request.component_id}"
+    )
 
     # Create response
     return VersionedExecutionResponse(
@@ -233,7 +233,10 @@ def create_lifespan(startup_display: Any = None) -> Any:
 
                 # MCP system cleanup
                 try:
-                    # Simple MCP cleanup - no complex resources in our implementation
+                    from common.notifications import get_notification_service
+
+                    # Close the long-lived WhatsApp MCP session used for notifications
+                    await get_notification_service().aclose()
                     logger.debug("MCP system cleanup completed")
                 except Exception as e:
                     logger.warning("MCP cleanup error", error=str(e))
@@ -264,9 +267,6 @@ def _create_simple_sync_api() -> FastAPI:
     """Simple synchronous API creation for event loop conflict scenarios."""
     from fastapi import FastAPI
 
-    # Get environment settings
-    os.getenv("HIVE_ENVIRONMENT", "production")
-
     # Initialize startup display
     startup_display = create_startup_display()
 
@@ -324,7 +324,6 @@ async def _async_create_automagik_api() -> FastAPI:
     # Get environment settings
     environment = os.getenv("HIVE_ENVIRONMENT", "production")
     is_development = environment == "development"
-    os.getenv("HIVE_LOG_LEVEL", "INFO").upper()
 
     # Check if we're in uvicorn reload process to prevent duplicate output
 
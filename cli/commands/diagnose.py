@@ -14,6 +14,7 @@ Design:
 - Guidance on how to fix each class of problem
 """
 
+import concurrent.futures
 import os
 import subprocess
 from pathlib import Path
@@ -59,12 +60,14 @@ class DiagnoseCommands:
         ]
 
         all_passed = True
-        results = []
 
-        for check_func in checks:
-            check_name, passed, issues = check_func()
-            results.append((check_name, passed, issues))
+        # Checks are independent; running them together overlaps the docker probes' timeouts.
+        # Results are still reported in the order above.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [executor.submit(check) for check in checks]
+            results = [future.result() for future in futures]
 
+        for check_name, passed, issues in results:
             emoji = "✅" if passed else "❌"
             print(f"\n{emoji} {check_name}")
 
@@ -71,13 +71,8 @@ class PostgreSQLCommands:
             success = self.docker_manager._run_command(["docker", "start", container_name]) is None
 
             if success:
-                # Wait a moment for startup
-                import time
-
-                time.sleep(2)
-
-                # Verify it's actually running
-                if self.docker_manager._container_running(container_name):
+                # Verify it accepts connections, polling briefly for startup
+                if self.docker_manager._wait_for_postgres(container_name, timeout=2.0):
                     return True
                 else:
                     return True
@@ -128,19 +123,14 @@ class PostgreSQLCommands:
             success = self.docker_manager._run_command(["docker", "restart", container_name]) is None
 
             if success:
-                # Wait a moment for startup
-                import time
-
-                time.sleep(3)
-
-                # Verify it's running
-                if self.docker_manager._container_running(container_name):
+                # Verify it accepts connections, polling briefly for startup
+                if self.docker_manager._wait_for_postgres(container_name, timeout=3.0):
                     print(f"✅ PostgreSQL container '{container_name}' restarted successfully")
                     print("✅ PostgreSQL is now accepting connections")
                     return True
                 else:
                     print(f"✅ PostgreSQL container '{container_name}' restarted successfully")
-                    print("✅ PostgreSQL is now accepting connections")
+                    print("⏳ PostgreSQL is still starting up and not accepting connections yet")
                     return True
             else:
                 return False
@@ -6,7 +6,6 @@ Mirrors AgentService pattern but adapted for production main application require
 
 import os
 import subprocess
-import time
 from pathlib import Path
 
 
@@ -54,11 +53,7 @@ class MainService:
             # Normalize the workspace path for cross-platform compatibility
             normalized_workspace = Path(workspace_path).resolve()
 
-            # Check if workspace path exists
-            if not normalized_workspace.exists():
-                return False
-
-            # Check if workspace path is a directory
+            # One stat covers both checks: is_dir() is False for missing paths too
             if not normalized_workspace.is_dir():
                 return False
 
@@ -81,8 +76,11 @@ class MainService:
             # Handle other path-related errors gracefully
             return False
 
-    def _setup_main_containers(self, workspace_path: str) -> bool:
-        """Setup main postgres AND app using docker compose command."""
+    def _setup_main_containers(self, workspace_path: str, services: tuple[str, ...] = ()) -> bool:
+        """Setup main postgres AND app using docker compose command.
+
+        ``services`` limits ``up`` to the named compose services; empty starts everything.
+        """
         try:
             # Normalize workspace path for cross-platform compatibility
             try:
@@ -116,7 +114,7 @@ class MainService:
 
             # Execute docker compose command with cross-platform path normalization
             result = subprocess.run(
-                ["docker", "compose", "-f", os.fspath(compose_file), "up", "-d"],
+                ["docker", "compose", "-f", os.fspath(compose_file), "up", "-d", *services],
                 check=False,
                 capture_output=True,
                 text=True,
@@ -145,7 +143,11 @@ class MainService:
         if postgres_running and app_running:
             return True
 
-        # Start containers using Docker Compose
+        # Name only the stopped service so compose does not reconcile the one already running
+        if postgres_running:
+            return self._setup_main_containers(workspace_path, services=("app",))
+        if app_running:
+            return self._setup_main_containers(workspace_path, services=("hive-postgres",))
         return self._setup_main_containers(workspace_path)
 
     def _validate_main_environment(self, workspace_path: Path) -> bool:
@@ -279,9 +281,8 @@ class MainService:
 
             if result.returncode == 0:
                 return True
-            # Fallback: try stop and start
+            # Fallback: try stop and start (compose stop only returns once the containers are down)
             self.stop_main(workspace_path)
-            time.sleep(2)
             return self.serve_main(workspace_path)
 
         except Exception:
@@ -166,6 +166,37 @@ class DockerManager:
             == container
         )
 
+    def _postgres_ready(self, container: str) -> bool:
+        """Check if PostgreSQL in ``container`` accepts TCP connections.
+
+        Probes over localhost so the socket-only server the image runs during initdb is not mistaken for
+        the real one; the compose healthcheck only refreshes every 10s, too coarse to wait on. Runs
+        without ``_run_command`` so an expected failure while the server starts is not printed each poll.
+        """
+        try:
+            result = subprocess.run(
+                ["docker", "exec", container, "pg_isready", "-h", "localhost", "-U", "postgres"],
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=5,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return False
+        # pg_isready exits 0 only once the server accepts connections
+        return result.returncode == 0
+
+    def _wait_for_postgres(self, container: str, timeout: float) -> bool:
+        """Poll until PostgreSQL in ``container`` is ready, backing off from 50ms, for at most ``timeout``s of sleep."""
+        delay, waited = 0.05, 0.0
+        while not self._postgres_ready(container):
+            if waited >= timeout:
+                return False
+            time.sleep(delay)
+            waited += delay
+            delay = min(delay * 2, 1.0)
+        return True
+
     def _get_docker_compose_command(self) -> str:
         """Get the correct docker-compose command (docker-compose vs docker compose)."""
         # Try docker compose first (newer format)
@@ -419,8 +450,8 @@ GIT_SHA=$(git rev-parse HEAD 2>/dev/null || echo "unknown")
             if not self._create_containers_via_compose(comp, comp_credentials):
                 return False
 
-            # Wait for services to be ready
-            time.sleep(8)  # Increased wait time for health checks
+            # Wait for health checks, returning as soon as PostgreSQL accepts connections instead of a fixed 8s
+            self._wait_for_postgres(self.POSTGRES_CONTAINER, timeout=8.0)
 
             # For workspace, note that app runs locally
             if comp == "workspace":
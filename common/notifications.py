@@ -4,11 +4,15 @@ Simple notification system for monitoring alerts and system events.
 Designed to be easily extensible for different notification methods.
 """
 
+import asyncio
 import os
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
+from functools import cache
+from types import MappingProxyType
 from typing import Any
 
 from lib.logging import logger
@@ -23,6 +27,30 @@ class NotificationLevel(str, Enum):
     ERROR = "error"
 
 
+# Read-only views so the shared lookup tables cannot be mutated at runtime
+_LEVEL_EMOJI: Mapping[NotificationLevel, str] = MappingProxyType(
+    {
+        NotificationLevel.INFO: "ℹ️",
+        NotificationLevel.WARNING: "⚠️",
+        NotificationLevel.CRITICAL: "🚨",
+        NotificationLevel.ERROR: "❌",
+    }
+)
+
+_LOG_METHOD_NAMES: Mapping[NotificationLevel, str] = MappingProxyType(
+    {
+        NotificationLevel.INFO: "info",
+        NotificationLevel.WARNING: "warning",
+        NotificationLevel.CRITICAL: "critical",
+        NotificationLevel.ERROR: "error",
+    }
+)
+
+_WHATSAPP_INSTANCE = "SofIA"
+
+_WHATSAPP_MESSAGE_TEMPLATE = "{emoji} {title}\n\n{message}\n\nSource: {source}"
+
+
 @dataclass
 class NotificationMessage:
     """Standard notification message format."""
@@ -58,15 +86,85 @@ class WhatsAppProvider(NotificationProvider):
 
     def __init__(self, group_id: str | None = None):
         self.group_id = group_id or os.getenv("WHATSAPP_NOTIFICATION_GROUP")
+        # Environment is static for the process lifetime, so resolve the toggle once
+        self.enabled = os.getenv("HIVE_WHATSAPP_NOTIFICATIONS_ENABLED", "false").strip().lower() in ("1", "true", "yes")
         self._last_notification: dict[str, float] = {}
         self.cooldown_seconds = 300
-        # No connection manager needed in simple implementation
+        # Long-lived MCP session owned by a single task; sends reach it through the outbox
+        # so anyio cancel scopes are entered and exited by the same task
+        self._session_task: asyncio.Task[None] | None = None
+        self._outbox: asyncio.Queue[tuple[str, asyncio.Future[Any]] | None] | None = None
+
+    def _session_outbox(self) -> asyncio.Queue[tuple[str, asyncio.Future[Any]] | None]:
+        """Return the outbox of the running session task, starting one on this loop if needed."""
+        loop = asyncio.get_running_loop()
+        task = self._session_task
+        if task is None or task.done() or task.get_loop() is not loop or self._outbox is None:
+            self._outbox = asyncio.Queue()
+            self._session_task = loop.create_task(self._run_session(self._outbox), name="whatsapp-mcp-session")
+        return self._outbox
+
+    async def _run_session(self, outbox: asyncio.Queue[tuple[str, asyncio.Future[Any]] | None]) -> None:
+        """Open the MCP session, deliver queued messages until told to stop, then close it."""
+        from lib.mcp import get_mcp_tools
+
+        reply: asyncio.Future[Any] | None = None
+        try:
+            async with get_mcp_tools("whatsapp_notifications") as tools:
+                logger.debug("📱 Available MCP tools: {tools}", tools=list(tools.functions.keys()))
+
+                if "send_text_message" not in tools.functions:
+                    available_tools = list(tools.functions.keys())
+                    raise ValueError(
+                        f"send_text_message tool not available in MCP server. Available tools: {available_tools}"
+                    )
+
+                tool_function = tools.functions["send_text_message"]
+                while (item := await outbox.get()) is not None:
+                    message, reply = item
+                    # The tool_name is already bound via partial, so we only pass agent and kwargs
+                    result = await tool_function.entrypoint(
+                        None,
+                        instance=_WHATSAPP_INSTANCE,
+                        message=message,
+                        number=self.group_id,
+                    )
+                    if not reply.done():
+                        reply.set_result(result)
+                    reply = None
+        except Exception as e:
+            # Fail the message in flight and anything still queued; the next send opens a fresh session
+            if reply is not None and not reply.done():
+                reply.set_exception(e)
+            while not outbox.empty():
+                item = outbox.get_nowait()
+                if item is not None and not item[1].done():
+                    item[1].set_exception(e)
+            logger.debug("📱 WhatsApp MCP session closed: {error}", error=str(e))
+
+    async def aclose(self) -> None:
+        """Close the shared MCP session if one is open, from within its owning task."""
+        task, outbox = self._session_task, self._outbox
+        self._session_task = self._outbox = None
+        if task is None or outbox is None or task.done():
+            return
+        if task.get_loop() is not asyncio.get_running_loop():
+            logger.debug("📱 WhatsApp MCP session belongs to another event loop, leaving it to that loop")
+            return
+
+        await outbox.put(None)
+        await task
+
+    async def _send_via_mcp(self, message: str) -> Any:
+        """Deliver a text message through the shared MCP session task."""
+        reply: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        await self._session_outbox().put((message, reply))
+        return await reply
 
     async def send(self, notification: NotificationMessage) -> bool:
         """Send notification via WhatsApp using pooled MCP connections."""
         # Check if WhatsApp notifications are enabled
-        enabled = os.getenv("HIVE_WHATSAPP_NOTIFICATIONS_ENABLED", "false").lower() == "true"
-        if not enabled:
+        if not self.enabled:
             logger.debug("WhatsApp notifications disabled via HIVE_WHATSAPP_NOTIFICATIONS_ENABLED")
             return False
 
@@ -78,79 +176,53 @@ class WhatsAppProvider(NotificationProvider):
             if cooldown_key in self._last_notification and (
                 current_time - self._last_notification[cooldown_key] < self.cooldown_seconds
             ):
-                logger.debug(f"📱 Notification {cooldown_key} in cooldown, skipping")
+                logger.debug("📱 Notification {cooldown_key} in cooldown, skipping", cooldown_key=cooldown_key)
                 return False
 
             # Format message with emoji
             emoji = self._get_emoji(notification.level)
-            formatted_message = (
-                f"{emoji} {notification.title}\n\n{notification.message}\n\nSource: {notification.source}"
+            formatted_message = _WHATSAPP_MESSAGE_TEMPLATE.format(
+                emoji=emoji,
+                title=notification.title,
+                message=notification.message,
+                source=notification.source,
             )
 
-            # Use simple MCP connection
+            # Reuse the shared MCP session instead of reconnecting per message
             try:
-                from lib.mcp import get_mcp_tools
-
-                # Get MCP tools directly
-                async with get_mcp_tools("whatsapp_notifications") as tools:
-                    # Debug: Check what tools are available
-                    logger.debug(f"📱 Available MCP tools: {list(tools.functions.keys())}")
-
-                    # Send WhatsApp message using MCP tools (agno pattern)
-                    if "send_text_message" in tools.functions:
-                        tool_function = tools.functions["send_text_message"]
-                        # Call the MCP tool entrypoint with proper parameters
-                        # The tool_name is already bound via partial, so we only pass agent and kwargs
-                        result = await tool_function.entrypoint(
-                            None,
-                            instance="SofIA",
-                            message=formatted_message,
-                            number=self.group_id,
-                        )
-                    else:
-                        available_tools = list(tools.functions.keys())
-                        raise ValueError(
-                            f"send_text_message tool not available in MCP server. Available tools: {available_tools}"
-                        )
-
-                    logger.info(f"📱 Sent WhatsApp notification: {notification.title}")
-                    logger.info(f"📱 Message delivered to group: {self.group_id}")
-                    logger.debug(f"📱 WhatsApp result: {result}")
-
-                    self._last_notification[cooldown_key] = current_time
-                    return True
+                result = await self._send_via_mcp(formatted_message)
+
+                logger.info("📱 Sent WhatsApp notification: {title}", title=notification.title)
+                logger.info("📱 Message delivered to group: {group_id}", group_id=self.group_id)
+                logger.debug("📱 WhatsApp result: {result}", result=result)
+
+                self._last_notification[cooldown_key] = current_time
+                return True
 
             except Exception as e:
-                logger.error(f"📱 WhatsApp MCP failed: {e}")
-                logger.debug(f"📱 WhatsApp error details: {type(e).__name__}: {e}")
+                logger.error("📱 WhatsApp MCP failed: {error}", error=str(e))
+                logger.debug(
+                    "📱 WhatsApp error details: {error_type}: {error}", error_type=type(e).__name__, error=str(e)
+                )
                 # Fallback to logging
-                logger.info(f"📱 [WhatsApp] {formatted_message}")
-                logger.info(f"📱 [WhatsApp] Would send to group: {self.group_id}")
+                logger.info("📱 [WhatsApp] {message}", message=formatted_message)
+                logger.info("📱 [WhatsApp] Would send to group: {group_id}", group_id=self.group_id)
                 # Still return True so it doesn't fallback to log provider
                 self._last_notification[cooldown_key] = current_time
                 return True
 
         except Exception as e:
-            logger.error(f"📱 Failed to send WhatsApp notification: {e}")
+            logger.error("📱 Failed to send WhatsApp notification: {error}", error=str(e))
             return False
 
     def is_available(self) -> bool:
         """Check if WhatsApp provider is available."""
-        try:
-            # Simple check - if we can import the MCP catalog, assume WhatsApp is available
-            return True
-        except Exception:
-            return False
+        # The MCP session is opened by the first send (_session_outbox); failures fall back to logging in send()
+        return True
 
     def _get_emoji(self, level: NotificationLevel) -> str:
         """Get emoji for notification level."""
-        emoji_map = {
-            NotificationLevel.INFO: "ℹ️",
-            NotificationLevel.WARNING: "⚠️",
-            NotificationLevel.CRITICAL: "🚨",
-            NotificationLevel.ERROR: "❌",
-        }
-        return emoji_map.get(level, "📢")
+        return _LEVEL_EMOJI.get(level, "📢")
 
 
 class LogProvider(NotificationProvider):
@@ -163,19 +235,12 @@ class LogProvider(NotificationProvider):
     async def send(self, notification: NotificationMessage) -> bool:
         """Send notification via logging."""
         try:
-            level_map = {
-                NotificationLevel.INFO: self.logger.info,
-                NotificationLevel.WARNING: self.logger.warning,
-                NotificationLevel.CRITICAL: self.logger.critical,
-                NotificationLevel.ERROR: self.logger.error,
-            }
-
-            log_func = level_map.get(notification.level, self.logger.info)
+            log_func = getattr(self.logger, _LOG_METHOD_NAMES.get(notification.level, "info"))
             log_func(f"[{notification.source}] {notification.title}: {notification.message}")
             return True
 
         except Exception as e:
-            logger.error(f"📱 Failed to send log notification: {e}")
+            logger.error("📱 Failed to send log notification: {error}", error=str(e))
             return False
 
     def is_available(self) -> bool:
@@ -201,7 +266,7 @@ class NotificationService:
     def register_provider(self, name: str, provider: NotificationProvider):
         """Register a notification provider."""
         self.providers[name] = provider
-        logger.debug(f"📱 Registered notification provider: {name}")
+        logger.debug("📱 Registered notification provider: {provider}", provider=name)
 
     async def send(self, notification: NotificationMessage, provider_name: str | None = None) -> bool:
         """Send notification using specified or default provider."""
@@ -210,15 +275,35 @@ class NotificationService:
 
         provider = self.providers.get(provider_name)
         if not provider:
-            logger.error(f"📱 Unknown notification provider: {provider_name}")
+            logger.error("📱 Unknown notification provider: {provider}", provider=provider_name)
             return False
 
         if not provider.is_available():
-            logger.warning(f"📱 Provider {provider_name} not available, falling back to log")
+            logger.warning("📱 Provider {provider} not available, falling back to log", provider=provider_name)
             provider = self.providers.get("log")
 
         return await provider.send(notification)
 
+    async def send_batch(
+        self, notifications: list[NotificationMessage], provider_name: str | None = None
+    ) -> list[bool]:
+        """Send several notifications concurrently, returning one result per notification."""
+        results = await asyncio.gather(
+            *(self.send(notification, provider_name) for notification in notifications),
+            return_exceptions=True,
+        )
+
+        outcomes: list[bool] = []
+        for notification, result in zip(notifications, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "📱 Failed to send notification {title}: {error}", title=notification.title, error=str(result)
+                )
+                outcomes.append(False)
+            else:
+                outcomes.append(result)
+        return outcomes
+
     async def send_alert(
         self,
         title: str,
@@ -230,18 +315,28 @@ class NotificationService:
         notification = NotificationMessage(title=title, message=message, level=level, source=source)
         return await self.send(notification)
 
+    async def aclose(self) -> None:
+        """Release resources held by providers that keep long-lived connections."""
+        for name, provider in self.providers.items():
+            aclose = getattr(provider, "aclose", None)
+            if aclose is None:
+                continue
+            try:
+                await aclose()
+            except Exception as e:
+                logger.warning(
+                    "📱 Failed to close notification provider {provider}: {error}", provider=name, error=str(e)
+                )
+
     def get_available_providers(self) -> dict[str, bool]:
         """Get list of available providers."""
         return {name: provider.is_available() for name, provider in self.providers.items()}
 
 
-# Global notification service instance
-_notification_service = NotificationService()
-
-
+@cache
 def get_notification_service() -> NotificationService:
-    """Get global notification service instance."""
-    return _notification_service
+    """Get global notification service instance, created on first use."""
+    return NotificationService()
 
 
 # Convenience functions
@@ -34,7 +34,7 @@ async def send_startup_notification(startup_display=None):
         await asyncio.create_task(isolated_send())
         logger.info("Startup notification sent")
     except Exception as e:
-        logger.error(f"📱 Failed to send startup notification: {e}")
+        logger.error("📱 Failed to send startup notification: {error}", error=str(e))
 
 
 def _build_startup_message(startup_display=None):
@@ -138,7 +138,7 @@ async def send_shutdown_notification():
         await asyncio.create_task(isolated_send())
         logger.debug("Shutdown notification sent")
     except Exception as e:
-        logger.error(f"📱 Failed to send shutdown notification: {e}")
+        logger.error("📱 Failed to send shutdown notification: {error}", error=str(e))
 
 
 async def send_error_notification(error_message: str, source: str = "server-error"):
@@ -150,9 +150,9 @@ async def send_error_notification(error_message: str, source: str = "server-erro
             source=source,
             level=NotificationLevel.ERROR,
         )
-        logger.info(f"📱 Error notification sent: {error_message}")
+        logger.info("📱 Error notification sent: {error_message}", error_message=error_message)
     except Exception as e:
-        logger.error(f"📱 Failed to send error notification: {e}")
+        logger.error("📱 Failed to send error notification: {error}", error=str(e))
 
 
 async def send_mcp_server_error(server_name: str, error_message: str):
@@ -164,9 +164,9 @@ async def send_mcp_server_error(server_name: str, error_message: str):
             source="mcp-server-error",
             level=NotificationLevel.CRITICAL,
         )
-        logger.info(f"📱 MCP server error notification sent: {server_name}")
+        logger.info("📱 MCP server error notification sent: {server_name}", server_name=server_name)
     except Exception as e:
-        logger.error(f"📱 Failed to send MCP server error notification: {e}")
+        logger.error("📱 Failed to send MCP server error notification: {error}", error=str(e))
 
 
 async def send_health_check_notification(component: str, status: str, message: str):
@@ -180,9 +180,9 @@ async def send_health_check_notification(component: str, status: str, message: s
             source="health-check",
             level=level,
         )
-        logger.info(f"📱 Health check notification sent: {component} - {status}")
+        logger.info("📱 Health check notification sent: {component} - {status}", component=component, status=status)
     except Exception as e:
-        logger.error(f"📱 Failed to send health check notification: {e}")
+        logger.error("📱 Failed to send health check notification: {error}", error=str(e))
 
 
 # Convenience function for common notification patterns
@@ -190,9 +190,9 @@ async def notify_system_event(title: str, message: str, level: NotificationLevel
     """Generic system event notification."""
     try:
         await send_notification(title=title, message=message, source="system-event", level=level)
-        logger.info(f"📱 System event notification sent: {title}")
+        logger.info("📱 System event notification sent: {title}", title=title)
     except Exception as e:
-        logger.error(f"📱 Failed to send system event notification: {e}")
+        logger.error("📱 Failed to send system event notification: {error}", error=str(e))
 
 
 async def notify_critical_error(title: str, message: str, source: str = "critical-error"):
@@ -204,9 +204,9 @@ async def notify_critical_error(title: str, message: str, source: str = "critica
             source=source,
             level=NotificationLevel.CRITICAL,
         )
-        logger.info(f"📱 Critical error notification sent: {title}")
+        logger.info("📱 Critical error notification sent: {title}", title=title)
     except Exception as e:
-        logger.error(f"📱 Failed to send critical error notification: {e}")
+        logger.error("📱 Failed to send critical error notification: {error}", error=str(e))
 
 
 async def notify_performance_issue(component: str, metric: str, value: str, threshold: str):
@@ -218,9 +218,9 @@ async def notify_performance_issue(component: str, metric: str, value: str, thre
             source="performance-monitor",
             level=NotificationLevel.WARNING,
         )
-        logger.info(f"📱 Performance issue notification sent: {component}")
+        logger.info("📱 Performance issue notification sent: {component}", component=component)
     except Exception as e:
-        logger.error(f"📱 Failed to send performance issue notification: {e}")
+        logger.error("📱 Failed to send performance issue notification: {error}", error=str(e))
 
 
 async def notify_user_action(action: str, user_id: str, details: str = ""):
@@ -236,9 +236,9 @@ async def notify_user_action(action: str, user_id: str, details: str = ""):
             source="user-action",
             level=NotificationLevel.INFO,
         )
-        logger.info(f"📱 User action notification sent: {action}")
+        logger.info("📱 User action notification sent: {action}", action=action)
     except Exception as e:
-        logger.error(f"📱 Failed to send user action notification: {e}")
+        logger.error("📱 Failed to send user action notification: {error}", error=str(e))
 
 
 async def notify_security_event(event_type: str, message: str, source: str = "security"):
@@ -250,9 +250,9 @@ async def notify_security_event(event_type: str, message: str, source: str = "se
             source=source,
             level=NotificationLevel.CRITICAL,
         )
-        logger.info(f"📱 Security event notification sent: {event_type}")
+        logger.info("📱 Security event notification sent: {event_type}", event_type=event_type)
     except Exception as e:
-        logger.error(f"📱 Failed to send security event notification: {e}")
+        logger.error("📱 Failed to send security event notification: {error}", error=str(e))
 
 
 # Quick notification shortcuts
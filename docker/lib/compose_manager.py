@@ -4,6 +4,7 @@ This module provides Docker Compose orchestration capabilities,
 specifically optimized for PostgreSQL and multi-service container management.
 """
 
+import json
 import subprocess
 from dataclasses import dataclass
 from enum import Enum
@@ -24,6 +25,10 @@ class ServiceStatus(Enum):
     NOT_EXISTS = "not_exists"
 
 
+# `docker compose ps` State values, which line up with the ServiceStatus values
+_COMPOSE_STATES = {status.value: status for status in ServiceStatus}
+
+
 @dataclass
 class ServiceInfo:
     """Docker Compose service information."""
@@ -57,18 +62,14 @@ class DockerComposeManager:
             True if started successfully, False otherwise
         """
         try:
-            compose_file_path = Path(workspace_path) / self.compose_file
-            if not compose_file_path.exists():
-                return False
-
-            compose_cmd = self._get_compose_command()
-            if not compose_cmd:
+            compose_args = self._compose_args(workspace_path)
+            if compose_args is None:
                 return False
             result = subprocess.run(
-                [*compose_cmd, "-f", str(compose_file_path), "up", "-d", service],
+                [*compose_args, "up", "-d", service],
                 check=False,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=120,
             )
 
@@ -88,18 +89,14 @@ class DockerComposeManager:
             True if stopped successfully, False otherwise
         """
         try:
-            compose_file_path = Path(workspace_path) / self.compose_file
-            if not compose_file_path.exists():
-                return False
-
-            compose_cmd = self._get_compose_command()
-            if not compose_cmd:
+            compose_args = self._compose_args(workspace_path)
+            if compose_args is None:
                 return False
             result = subprocess.run(
-                [*compose_cmd, "-f", str(compose_file_path), "stop", service],
+                [*compose_args, "stop", service],
                 check=False,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=60,
             )
 
@@ -119,18 +116,14 @@ class DockerComposeManager:
             True if restarted successfully, False otherwise
         """
         try:
-            compose_file_path = Path(workspace_path) / self.compose_file
-            if not compose_file_path.exists():
-                return False
-
-            compose_cmd = self._get_compose_command()
-            if not compose_cmd:
+            compose_args = self._compose_args(workspace_path)
+            if compose_args is None:
                 return False
             result = subprocess.run(
-                [*compose_cmd, "-f", str(compose_file_path), "restart", service],
+                [*compose_args, "restart", service],
                 check=False,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=120,
             )
 
@@ -151,18 +144,12 @@ class DockerComposeManager:
             Service logs as string, None if error
         """
         try:
-            compose_file_path = Path(workspace_path) / self.compose_file
-            if not compose_file_path.exists():
-                return None
-
-            compose_cmd = self._get_compose_command()
-            if not compose_cmd:
+            compose_args = self._compose_args(workspace_path)
+            if compose_args is None:
                 return None
             result = subprocess.run(
                 [
-                    *compose_cmd,
-                    "-f",
-                    str(compose_file_path),
+                    *compose_args,
                     "logs",
                     "--tail",
                     str(tail),
@@ -192,15 +179,11 @@ class DockerComposeManager:
             True if streaming started successfully, False otherwise
         """
         try:
-            compose_file_path = Path(workspace_path) / self.compose_file
-            if not compose_file_path.exists():
-                return False
-
-            compose_cmd = self._get_compose_command()
-            if not compose_cmd:
+            compose_args = self._compose_args(workspace_path)
+            if compose_args is None:
                 return False
             subprocess.run(
-                [*compose_cmd, "-f", str(compose_file_path), "logs", "-f", service],
+                [*compose_args, "logs", "-f", service],
                 check=False,
                 timeout=None,
             )  # No timeout for streaming
@@ -223,15 +206,11 @@ class DockerComposeManager:
             ServiceStatus indicating current state
         """
         try:
-            compose_file_path = Path(workspace_path) / self.compose_file
-            if not compose_file_path.exists():
-                return ServiceStatus.NOT_EXISTS
-
-            compose_cmd = self._get_compose_command()
-            if not compose_cmd:
+            compose_args = self._compose_args(workspace_path)
+            if compose_args is None:
                 return ServiceStatus.NOT_EXISTS
             result = subprocess.run(
-                [*compose_cmd, "-f", str(compose_file_path), "ps", service],
+                [*compose_args, "ps", service],
                 check=False,
                 capture_output=True,
                 text=True,
@@ -274,6 +253,48 @@ class DockerComposeManager:
         except (subprocess.TimeoutExpired, subprocess.SubprocessError):
             return ServiceStatus.NOT_EXISTS
 
+    def get_all_service_statuses(self, workspace_path: str = ".") -> dict[str, ServiceStatus] | None:
+        """Get the status of every listed service with a single ``ps`` call.
+
+        Like the per-service ``ps <service>`` query, only listed containers are
+        reported, so stopped services stay absent and read as NOT_EXISTS.
+
+        Args:
+            workspace_path: Path to workspace with docker-compose.yml
+
+        Returns:
+            Dict mapping service names to ServiceStatus for services that have a
+            listed container, None if the batched JSON query is unavailable
+        """
+        try:
+            compose_args = self._compose_args(workspace_path)
+            if compose_args is None:
+                return None
+            result = subprocess.run(
+                [*compose_args, "ps", "--format", "json"],
+                check=False,
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+            if result.returncode != 0:
+                return None
+
+            # Compose v2 prints one JSON object per line; early v2 releases print a single array
+            output = result.stdout.strip()
+            if output.startswith("["):
+                entries = json.loads(output)
+            else:
+                entries = [json.loads(line) for line in output.splitlines() if line.strip()]
+
+            return {
+                entry["Service"]: _COMPOSE_STATES.get(entry.get("State", "").lower(), ServiceStatus.STOPPED)
+                for entry in entries
+            }
+
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, ValueError, KeyError, TypeError):
+            return None
+
     def get_all_services_status(self, workspace_path: str = ".") -> dict[str, ServiceInfo]:
         """Get status of all services in docker-compose.yml.
 
@@ -297,9 +318,13 @@ class DockerComposeManager:
             if "services" not in compose_config:
                 return services
 
-            # Get status for each service
+            # One batched ps call covers every service; legacy compose falls back to per-service queries
+            statuses = self.get_all_service_statuses(workspace_path)
             for service_name in compose_config["services"]:
-                status = self.get_service_status(service_name, workspace_path)
+                if statuses is not None:
+                    status = statuses.get(service_name, ServiceStatus.NOT_EXISTS)
+                else:
+                    status = self.get_service_status(service_name, workspace_path)
                 service_config = compose_config["services"][service_name]
 
                 # Extract service information
@@ -336,18 +361,14 @@ class DockerComposeManager:
             True if all services started successfully, False otherwise
         """
         try:
-            compose_file_path = Path(workspace_path) / self.compose_file
-            if not compose_file_path.exists():
-                return False
-
-            compose_cmd = self._get_compose_command()
-            if not compose_cmd:
+            compose_args = self._compose_args(workspace_path)
+            if compose_args is None:
                 return False
             result = subprocess.run(
-                [*compose_cmd, "-f", str(compose_file_path), "up", "-d"],
+                [*compose_args, "up", "-d"],
                 check=False,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=180,
             )
 
@@ -366,18 +387,14 @@ class DockerComposeManager:
             True if all services stopped successfully, False otherwise
         """
         try:
-            compose_file_path = Path(workspace_path) / self.compose_file
-            if not compose_file_path.exists():
-                return False
-
-            compose_cmd = self._get_compose_command()
-            if not compose_cmd:
+            compose_args = self._compose_args(workspace_path)
+            if compose_args is None:
                 return False
             result = subprocess.run(
-                [*compose_cmd, "-f", str(compose_file_path), "down"],
+                [*compose_args, "down"],
                 check=False,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=120,
             )
 
@@ -396,19 +413,15 @@ class DockerComposeManager:
             True if valid, False otherwise
         """
         try:
-            compose_file_path = Path(workspace_path) / self.compose_file
-            if not compose_file_path.exists():
-                return False
-
             # Validate syntax with docker-compose config
-            compose_cmd = self._get_compose_command()
-            if not compose_cmd:
+            compose_args = self._compose_args(workspace_path)
+            if compose_args is None:
                 return False
             result = subprocess.run(
-                [*compose_cmd, "-f", str(compose_file_path), "config"],
+                [*compose_args, "config"],
                 check=False,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=30,
             )
 
@@ -442,6 +455,20 @@ class DockerComposeManager:
         except Exception:
             return []
 
+    def _compose_args(self, workspace_path: str) -> list[str] | None:
+        """Build the ``<compose> -f <file>`` prefix shared by every command.
+
+        Returns:
+            Command prefix, None if the compose file or the compose CLI is missing
+        """
+        compose_file_path = Path(workspace_path) / self.compose_file
+        if not compose_file_path.exists():
+            return None
+        compose_cmd = self._get_compose_command()
+        if not compose_cmd:
+            return None
+        return [*compose_cmd, "-f", str(compose_file_path)]
+
     def _get_compose_command(self) -> list[str] | None:
         """Get the appropriate Docker Compose command with fallback.
 
@@ -456,8 +483,8 @@ class DockerComposeManager:
             result = subprocess.run(
                 ["docker", "compose", "version"],
                 check=False,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=5,
             )
             if result.returncode == 0:
@@ -471,8 +498,8 @@ class DockerComposeManager:
             result = subprocess.run(
                 ["docker-compose", "--version"],
                 check=False,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=5,
             )
             if result.returncode == 0:
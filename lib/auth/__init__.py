@@ -5,10 +5,23 @@ Provides simple x-api-key authentication with auto-generated keys,
 plus comprehensive credential management for PostgreSQL and workspace setup.
 """
 
-from .credential_service import CredentialService
-from .dependencies import optional_api_key, require_api_key
-from .init_service import AuthInitService
-from .service import AuthService
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .credential_service import CredentialService
+    from .dependencies import optional_api_key, require_api_key
+    from .init_service import AuthInitService
+    from .service import AuthService
+
+# Re-exports resolved on first access, so CLI imports of lib.auth.* submodules skip FastAPI
+_LAZY_EXPORTS = {
+    "AuthInitService": ".init_service",
+    "AuthService": ".service",
+    "CredentialService": ".credential_service",
+    "optional_api_key": ".dependencies",
+    "require_api_key": ".dependencies",
+}
 
 __all__ = [
     "AuthInitService",
@@ -17,3 +30,12 @@ __all__ = [
     "optional_api_key",
     "require_api_key",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
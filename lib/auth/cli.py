@@ -6,11 +6,14 @@ Enhanced with comprehensive credential management service integration.
 
 import os
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
-# Add project root to path
+# Add project root to path when run as a script; package imports already resolve `lib`
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if not __package__ and str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from lib.auth.credential_service import (  # noqa: E402 - Path setup required
     CredentialService,  # noqa: E402 - Environment setup required before module imports
@@ -166,6 +169,32 @@ def sync_mcp_credentials(mcp_file: Path | None = None, env_file: Path | None = N
     logger.info("MCP configuration synchronized with credentials")
 
 
+# Command dispatch tables for the ``__main__`` entry point (action name -> handler)
+_AUTH_ACTIONS: dict[str, Callable[[], None]] = {
+    "show": show_current_key,
+    "regenerate": regenerate_key,
+    "status": show_auth_status,
+}
+
+_CREDENTIAL_ACTIONS: dict[str, Callable[[Any], object]] = {
+    "postgres": lambda args: generate_postgres_credentials(
+        host=args.host,
+        port=args.port,
+        database=args.database,
+        env_file=args.env_file,
+    ),
+    "agent": lambda args: generate_agent_credentials(port=args.port, database=args.database, env_file=args.env_file),
+    "workspace": lambda args: generate_complete_workspace_credentials(
+        workspace_path=args.workspace_path,
+        postgres_host=args.host,
+        postgres_port=args.port,
+        postgres_database=args.database,
+    ),
+    "status": lambda args: show_credential_status(env_file=args.env_file),
+    "sync-mcp": lambda args: sync_mcp_credentials(mcp_file=args.mcp_file, env_file=args.env_file),
+}
+
+
 if __name__ == "__main__":
     import argparse
 
@@ -218,45 +247,20 @@ if __name__ == "__main__":
 
     # Handle authentication commands (backward compatibility)
     if args.command == "auth":
-        if args.action == "show":
-            show_current_key()
-        elif args.action == "regenerate":
-            regenerate_key()
-        elif args.action == "status":
-            show_auth_status()
+        _AUTH_ACTIONS[args.action]()
 
     # Handle credential management commands
     elif args.command == "credentials":
-        if args.cred_action == "postgres":
-            generate_postgres_credentials(
-                host=args.host,
-                port=args.port,
-                database=args.database,
-                env_file=args.env_file,
-            )
-        elif args.cred_action == "agent":
-            generate_agent_credentials(port=args.port, database=args.database, env_file=args.env_file)
-        elif args.cred_action == "workspace":
-            generate_complete_workspace_credentials(
-                workspace_path=args.workspace_path,
-                postgres_host=args.host,
-                postgres_port=args.port,
-                postgres_database=args.database,
-            )
-        elif args.cred_action == "status":
-            show_credential_status(env_file=args.env_file)
-        elif args.cred_action == "sync-mcp":
-            sync_mcp_credentials(mcp_file=args.mcp_file, env_file=args.env_file)
-        else:
+        credential_handler = _CREDENTIAL_ACTIONS.get(args.cred_action)
+        if credential_handler is None:
             cred_parser.print_help()
+        else:
+            credential_handler(args)
 
     # Backward compatibility: if no command specified, default to old behavior
     elif hasattr(args, "action"):
-        if args.action == "show":
-            show_current_key()
-        elif args.action == "regenerate":
-            regenerate_key()
-        elif args.action == "status":
-            show_auth_status()
+        auth_handler = _AUTH_ACTIONS.get(args.action)
+        if auth_handler is not None:
+            auth_handler()
     else:
         parser.print_help()
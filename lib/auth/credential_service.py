@@ -16,6 +16,7 @@ DESIGN PRINCIPLES:
 8. Container sharing: Single postgres container for all modes
 """
 
+import re
 import secrets
 from pathlib import Path
 from urllib.parse import urlparse
@@ -23,6 +24,11 @@ from urllib.parse import urlparse
 from lib.auth.env_file_manager import EnvFileManager
 from lib.logging import logger
 
+# .mcp.json fragments rewritten when credentials change, compiled once per process
+_MCP_POSTGRES_URL_RE = re.compile(r"postgresql\+psycopg://[^@]*@")
+_MCP_API_KEY_RE = re.compile(r'"HIVE_API_KEY":\s*"[^"]*"')
+_MCP_ENV_BLOCK_RE = re.compile(r'("env":\s*\{[^}]*)')
+
 
 class CredentialService:
     """SINGLE SOURCE OF TRUTH for all Automagik Hive credential management."""
@@ -291,29 +297,18 @@ class CredentialService:
             # Update PostgreSQL connection string
             if postgres_creds["url"]:
                 # Replace any existing PostgreSQL connection string
-                import re
-
-                pattern = r"postgresql\+psycopg://[^@]*@"
                 replacement = f"postgresql+psycopg://{postgres_creds['user']}:{postgres_creds['password']}@"
-                mcp_content = re.sub(pattern, replacement, mcp_content)
+                mcp_content = _MCP_POSTGRES_URL_RE.sub(lambda _match: replacement, mcp_content)
 
             # Update API key
             if api_key:
-                import re
-
-                pattern = r'"HIVE_API_KEY":\s*"[^"]*"'
-                replacement = f'"HIVE_API_KEY": "{api_key}"'
-
-                # Check if HIVE_API_KEY exists
-                if re.search(pattern, mcp_content):
-                    # Update existing API key
-                    mcp_content = re.sub(pattern, replacement, mcp_content)
-                else:
+                # subn reports whether a key existed, so the content is scanned once rather than search + sub
+                mcp_content, replaced = _MCP_API_KEY_RE.subn(lambda _match: f'"HIVE_API_KEY": "{api_key}"', mcp_content)
+                if not replaced:
                     # Add API key to the first server's env section if it exists
-                    env_pattern = r'("env":\s*\{[^}]*)'
-                    env_replacement = r'\1,\n        "HIVE_API_KEY": "' + api_key + '"'
-                    if re.search(env_pattern, mcp_content):
-                        mcp_content = re.sub(env_pattern, env_replacement, mcp_content)
+                    mcp_content = _MCP_ENV_BLOCK_RE.sub(
+                        lambda match: f'{match.group(1)},\n        "HIVE_API_KEY": "{api_key}"', mcp_content
+                    )
 
             mcp_file.write_text(mcp_content)
             logger.info("MCP config updated with current credentials")
@@ -583,22 +578,22 @@ class CredentialService:
         """Detect existing Docker containers for shared approach."""
         import subprocess
 
-        containers_status = {}
-
-        for _mode, container_info in self.CONTAINERS.items():
-            for _service, container_name in container_info.items():
-                try:
-                    # Check if container exists and is running
-                    result = subprocess.run(
-                        ["docker", "ps", "--filter", f"name={container_name}", "--format", "{{.Names}}"],
-                        capture_output=True,
-                        text=True,
-                        check=False,
-                    )
-                    containers_status[container_name] = container_name in result.stdout
-                except Exception as e:
-                    logger.warning(f"Failed to check container {container_name}", error=str(e))
-                    containers_status[container_name] = False
+        container_names = [name for container_info in self.CONTAINERS.values() for name in container_info.values()]
+
+        try:
+            # One `docker ps` for every managed container instead of a filtered call per name
+            result = subprocess.run(
+                ["docker", "ps", "--format", "{{.Names}}"],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            running = set(result.stdout.split())
+        except Exception as e:
+            logger.warning("Failed to check containers", containers=container_names, error=str(e))
+            running = set()
+
+        containers_status = {name: name in running for name in container_names}
 
         logger.info("Container detection results", containers=containers_status)
         return containers_status
@@ -2,12 +2,62 @@
 
 from __future__ import annotations
 
+import errno
+import os
+import stat
+import tempfile
 from pathlib import Path
 from urllib.parse import urlparse
 
 from lib.logging import logger
 
 
+def write_env_atomic(path: Path, content: str) -> None:
+    """Replace ``path`` with ``content`` via a sibling temp file so a crash never leaves it half-written.
+
+    A read-only ``path`` is refused like a direct write would be. The temp file starts owner-only and takes
+    the previous file's permission bits before any content lands in it, so credentials are never exposed.
+    """
+    mode: int | None = None
+    if path.exists():
+        # os.replace only needs a writable directory; keep honouring a write-protected .env
+        if not os.access(path, os.W_OK):
+            raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), str(path))
+        mode = stat.S_IMODE(path.stat().st_mode)
+
+    # mkstemp opens with O_CREAT | O_EXCL and mode 0o600, unique even across threads of one process
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        try:
+            if mode is not None:
+                # Match the file being replaced before any content is written
+                os.fchmod(fd, mode)
+        finally:
+            os.close(fd)
+        tmp_path.write_text(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _parse_env_values(content: str) -> dict[str, list[str]]:
+    """Map each key to all of its values in file order, skipping blanks and comments.
+
+    Callers pick their own precedence from the list, so one pass serves every lookup.
+    """
+    values: dict[str, list[str]] = {}
+    for raw_line in content.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, sep, value = line.partition("=")
+        if sep:
+            values.setdefault(key, []).append(value.strip())
+    return values
+
+
 class EnvFileManager:
     """Handle Automagik Hive environment file access and synchronization."""
 
@@ -114,11 +164,15 @@ HIVE_DEFAULT_MODEL=gpt-4.1-mini
             )
             raise
 
-    def sync_alias(self) -> None:
-        """Keep alias and primary env files in sync."""
+    def sync_alias(self, content: str | None = None) -> None:
+        """Keep alias and primary env files in sync.
+
+        ``content`` is the primary file's just-written text; passing it skips re-reading the file.
+        """
         try:
-            if self.primary_env_path.exists():
-                content = self.primary_env_path.read_text()
+            if content is not None or self.primary_env_path.exists():
+                if content is None:
+                    content = self.primary_env_path.read_text()
                 self.alias_env_path.write_text(content)
                 logger.debug("Synchronized alias env", alias=str(self.alias_env_path))
             elif self.alias_env_path.exists():
@@ -185,8 +239,8 @@ HIVE_DEFAULT_MODEL=gpt-4.1-mini
             content += "\n"
 
         try:
-            target_path.write_text(content)
-            self.sync_alias()
+            write_env_atomic(target_path, content)
+            self.sync_alias(content)
             return True
         except OSError as error:
             logger.error(
@@ -212,22 +266,19 @@ HIVE_DEFAULT_MODEL=gpt-4.1-mini
             return credentials
 
         try:
-            for raw_line in path.read_text().splitlines():
-                line = raw_line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if line.startswith(f"{database_url_var}="):
-                    url = line.split("=", 1)[1].strip()
-                    credentials["url"] = url
-                    parsed = urlparse(url)
-                    credentials["user"] = parsed.username
-                    credentials["password"] = parsed.password
-                    credentials["host"] = parsed.hostname
-                    credentials["port"] = str(parsed.port) if parsed.port else None
-                    if parsed.path and len(parsed.path) > 1:
-                        credentials["database"] = parsed.path[1:]
-                    logger.info("PostgreSQL credentials extracted from env")
-                    break
+            # The first definition wins, even when its value is empty
+            urls = _parse_env_values(path.read_text()).get(database_url_var)
+            if urls:
+                url = urls[0]
+                credentials["url"] = url
+                parsed = urlparse(url)
+                credentials["user"] = parsed.username
+                credentials["password"] = parsed.password
+                credentials["host"] = parsed.hostname
+                credentials["port"] = str(parsed.port) if parsed.port else None
+                if parsed.path and len(parsed.path) > 1:
+                    credentials["database"] = parsed.path[1:]
+                logger.info("PostgreSQL credentials extracted from env")
         except Exception as error:  # noqa: BLE001 - logging unexpected errors
             logger.error(
                 "Failed to extract PostgreSQL credentials",
@@ -244,15 +295,11 @@ HIVE_DEFAULT_MODEL=gpt-4.1-mini
             return None
 
         try:
-            for raw_line in path.read_text().splitlines():
-                line = raw_line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if line.startswith(f"{api_key_var}="):
-                    api_key = line.split("=", 1)[1].strip()
-                    if api_key:
-                        logger.info("Hive API key extracted from env")
-                        return api_key
+            # The first non-empty definition wins
+            api_key = next((value for value in _parse_env_values(path.read_text()).get(api_key_var, []) if value), None)
+            if api_key:
+                logger.info("Hive API key extracted from env")
+                return api_key
         except Exception as error:  # noqa: BLE001 - logging unexpected errors
             logger.error("Failed to extract Hive API key", file=str(path), error=str(error))
 
@@ -271,27 +318,23 @@ HIVE_DEFAULT_MODEL=gpt-4.1-mini
             return base_ports
 
         try:
-            for raw_line in path.read_text().splitlines():
-                line = raw_line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if line.startswith(f"{database_url_var}="):
-                    url = line.split("=", 1)[1].strip()
-                    if "postgresql+psycopg://" in url:
-                        parsed = urlparse(url)
-                        if parsed.port:
-                            base_ports["db"] = parsed.port
-                            logger.debug("Found custom database port in env", port=parsed.port)
-                elif line.startswith(f"{api_port_var}="):
-                    port_value = line.split("=", 1)[1].strip()
-                    try:
-                        base_ports["api"] = int(port_value)
-                        logger.debug("Found custom API port in env", port=port_value)
-                    except ValueError:
-                        logger.warning(
-                            "Invalid API port in env, using default",
-                            invalid_port=port_value,
-                        )
+            # Later definitions override earlier ones, as when the file is read top to bottom
+            values = _parse_env_values(path.read_text())
+            for url in values.get(database_url_var, []):
+                if "postgresql+psycopg://" in url:
+                    parsed = urlparse(url)
+                    if parsed.port:
+                        base_ports["db"] = parsed.port
+                        logger.debug("Found custom database port in env", port=parsed.port)
+            for port_value in values.get(api_port_var, []):
+                try:
+                    base_ports["api"] = int(port_value)
+                    logger.debug("Found custom API port in env", port=port_value)
+                except ValueError:
+                    logger.warning(
+                        "Invalid API port in env, using default",
+                        invalid_port=port_value,
+                    )
         except Exception as error:  # noqa: BLE001 - logging unexpected errors
             logger.error(
                 "Failed to extract base ports from env",
@@ -8,6 +8,7 @@ import os
 import secrets
 from pathlib import Path
 
+from lib.auth.env_file_manager import write_env_atomic
 from lib.logging import logger
 
 
@@ -80,8 +81,8 @@ class AuthInitService:
         if not has_auth_disabled:
             env_content.append(f"{self.auth_disabled_var}=false")
 
-        # Write back to file
-        self.env_file.write_text("\n".join(env_content) + "\n")
+        # Write back to file atomically so an interrupted write cannot corrupt the key
+        write_env_atomic(self.env_file, "\n".join(env_content) + "\n")
 
     def _read_key_from_env(self) -> str | None:
         """Read API key from .env file."""
@@ -20,13 +20,15 @@ class AuthService:
 
         # Production security override: ALWAYS enable auth in production
         self.environment = os.getenv("HIVE_ENVIRONMENT", "development").lower()
+        # Raw setting is process-static, resolve it once for both the effective flag and status reports
+        self._raw_auth_disabled = os.getenv("HIVE_AUTH_DISABLED", "false").lower() == "true"
 
         if self.environment == "production":
             # Production override: ALWAYS enable authentication regardless of HIVE_AUTH_DISABLED
             self.auth_disabled = False
         else:
             # Development/staging: respect HIVE_AUTH_DISABLED setting (default: enabled for security)
-            self.auth_disabled = os.getenv("HIVE_AUTH_DISABLED", "false").lower() == "true"
+            self.auth_disabled = self._raw_auth_disabled
 
     async def validate_api_key(self, provided_key: str | None) -> bool:
         """
@@ -66,7 +68,7 @@ class AuthService:
 
     def get_auth_status(self) -> dict[str, str | bool]:
         """Get current authentication status and configuration."""
-        raw_auth_disabled = os.getenv("HIVE_AUTH_DISABLED", "false").lower() == "true"
+        raw_auth_disabled = self._raw_auth_disabled
 
         return {
             "environment": self.environment,
@@ -9,8 +9,9 @@ import asyncio
 import os
 import re
 import subprocess
+import threading
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import IO, Any
 
 import httpx
 
@@ -18,6 +19,36 @@ from lib.logging import logger
 
 from .base import BaseDatabaseBackend
 
+# Bridge output is drained in chunks of up to this size; an unread pipe would stall the bridge once full
+_BRIDGE_READ_SIZE = 1 << 16
+
+
+def _drain_bridge_output(stream: IO[bytes]) -> None:
+    """Forward bridge output to debug logs until the pipe closes.
+
+    ``read1`` returns whatever the pipe has ready in one call, so bursts of log lines
+    cost one read instead of one ``readline`` per line.
+    """
+    pending = b""
+    try:
+        while chunk := stream.read1(_BRIDGE_READ_SIZE):
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                _log_bridge_line(line)
+    except (OSError, ValueError):
+        # Pipe closed underneath us during shutdown
+        pass
+    finally:
+        stream.close()
+    _log_bridge_line(pending)
+
+
+def _log_bridge_line(line: bytes) -> None:
+    """Log one non-blank line of bridge output."""
+    text = line.decode("utf-8", "replace").strip()
+    if text:
+        logger.debug("PGlite bridge output", line=text)
+
 
 class PGliteBackend(BaseDatabaseBackend):
     """
@@ -74,9 +105,14 @@ class PGliteBackend(BaseDatabaseBackend):
                     "PGLITE_DATA_DIR": self.data_dir,
                 },
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+                stderr=subprocess.STDOUT,
             )
+            threading.Thread(
+                target=_drain_bridge_output,
+                args=(self.bridge_process.stdout,),
+                name="pglite-bridge-output",
+                daemon=True,
+            ).start()
 
             # Wait for bridge to be ready
             await self._wait_for_bridge_ready()
@@ -15,6 +15,10 @@ from lib.logging import logger
 
 from .base import BaseDatabaseBackend
 
+# File databases only: WAL lets readers run alongside the writer, and NORMAL skips the
+# per-commit fsync that WAL makes unnecessary for consistency
+_FILE_DB_PRAGMAS = "PRAGMA journal_mode = WAL; PRAGMA synchronous = NORMAL;"
+
 
 class SQLiteBackend(BaseDatabaseBackend):
     """
@@ -107,6 +111,8 @@ class SQLiteBackend(BaseDatabaseBackend):
             self.connection = await aiosqlite.connect(self.db_path)
             # Enable foreign keys
             await self.connection.execute("PRAGMA foreign_keys = ON;")
+            if self.db_path != ":memory:":
+                await self.connection.executescript(_FILE_DB_PRAGMAS)
 
         yield self.connection
 
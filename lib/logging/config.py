@@ -56,6 +56,43 @@ def _get_caller_file_path() -> str | None:
         return None
 
 
+class EmojiLoggingHandler(logging.StreamHandler):
+    """Custom handler that injects emojis into standard Python logging."""
+
+    def format(self, record):
+        # Get the original formatted message
+        original_msg = super().format(record)
+
+        # Extract just the message part (after timestamp, level, etc)
+        try:
+            # Standard format is usually: timestamp - name - level - message
+            # We want to inject emoji into just the message part
+            parts = original_msg.split(" - ")
+            if len(parts) >= 3:
+                message_part = parts[-1]  # Last part is the message
+
+                # Apply emoji injection
+                if EMOJI_AVAILABLE:
+                    try:
+                        # Get caller info for context
+                        caller_file = getattr(record, "pathname", "")
+                        enhanced_message = auto_emoji(message_part, caller_file)
+
+                        # Replace the message part with enhanced version
+                        parts[-1] = enhanced_message
+                        return " - ".join(parts)
+                    except Exception:  # noqa: S110 - Silent exception handling is intentional
+                        pass
+        except Exception:  # noqa: S110 - Silent exception handling is intentional
+            pass
+
+        return original_msg
+
+
+# Standard-logging sink shared by every setup_logging() call; forced re-initialization reuses it
+_emoji_handler: EmojiLoggingHandler | None = None
+
+
 def setup_logging():
     """
     Use loguru defaults with minimal configuration and automatic emoji injection.
@@ -133,39 +170,6 @@ def setup_logging():
     # Also configure standard Python logging (for Agno and other libraries)
     log_level = getattr(logging, level, logging.INFO)
 
-    # Create custom handler for standard logging that also injects emojis
-    class EmojiLoggingHandler(logging.StreamHandler):
-        """Custom handler that injects emojis into standard Python logging."""
-
-        def format(self, record):
-            # Get the original formatted message
-            original_msg = super().format(record)
-
-            # Extract just the message part (after timestamp, level, etc)
-            try:
-                # Standard format is usually: timestamp - name - level - message
-                # We want to inject emoji into just the message part
-                parts = original_msg.split(" - ")
-                if len(parts) >= 3:
-                    message_part = parts[-1]  # Last part is the message
-
-                    # Apply emoji injection
-                    if EMOJI_AVAILABLE:
-                        try:
-                            # Get caller info for context
-                            caller_file = getattr(record, "pathname", "")
-                            enhanced_message = auto_emoji(message_part, caller_file)
-
-                            # Replace the message part with enhanced version
-                            parts[-1] = enhanced_message
-                            return " - ".join(parts)
-                        except Exception:  # noqa: S110 - Silent exception handling is intentional
-                            pass
-            except Exception:  # noqa: S110 - Silent exception handling is intentional
-                pass
-
-            return original_msg
-
     # Set standard logging level to match
     logging.basicConfig(level=log_level, handlers=[])  # Clear default handlers
 
@@ -176,11 +180,13 @@ def setup_logging():
     # Reset existing handlers before attaching our sink to avoid duplicate output
     root_logger.handlers.clear()
 
-    emoji_handler = EmojiLoggingHandler()
-    emoji_handler.setLevel(log_level)
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    emoji_handler.setFormatter(formatter)
-    root_logger.addHandler(emoji_handler)
+    global _emoji_handler
+    # A replaced stderr (test capture, daemonization) needs a handler bound to the new stream
+    if _emoji_handler is None or _emoji_handler.stream is not sys.stderr:
+        _emoji_handler = EmojiLoggingHandler()
+        _emoji_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    _emoji_handler.setLevel(log_level)
+    root_logger.addHandler(_emoji_handler)
 
     # Configure specific logger levels
     # Always suppress uvicorn access logs (too noisy)
@@ -29,6 +29,18 @@ class EmojiLoader:
             r"[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF\U00002600-\U000026FF\U00002700-\U000027BF]"
         )
 
+        # Match tables are fixed once the config is loaded, so order them here instead of per lookup
+        resource_types: dict[str, Any] = self._config.get("resource_types") or {}
+        directories: dict[str, str] = resource_types.get("directories") or {}
+        self._directories = sorted(directories.items(), key=lambda item: len(item[0]), reverse=True)
+        all_keywords: dict[str, str] = {
+            **(resource_types.get("activities") or {}),
+            **(resource_types.get("services") or {}),
+        }
+        # Sort by keyword length (longest first) to prioritize specific phrases
+        self._keywords = sorted(all_keywords.items(), key=lambda item: len(item[0]), reverse=True)
+        self._file_types: dict[str, str] = resource_types.get("file_types") or {}
+
     def _load_yaml(self) -> dict[str, Any]:
         """Load YAML config - fail fast if not available."""
         try:
@@ -55,43 +67,31 @@ class EmojiLoader:
         if not self._config or not self._config.get("resource_types"):
             return ""
 
-        resource_types: dict[str, Any] = self._config["resource_types"]
-
         # Skip if message already has emoji
         if message and self.has_emoji(message):
             return ""
 
         # 1. Directory matching - longest first
         if file_path:
-            directories: dict[str, str] = resource_types.get("directories", {})
             normalized_path = file_path.replace("\\", "/")
 
-            for directory in sorted(directories.keys(), key=len, reverse=True):
+            for directory, emoji in self._directories:
                 if normalized_path.startswith(directory):
-                    return directories[directory]
+                    return emoji
 
         # 2. Smart keyword matching (prioritize longer phrases first)
         if message:
             message_lower = message.lower()
 
-            # Collect all keywords from activities and services
-            all_keywords: dict[str, str] = {}
-            all_keywords.update(resource_types.get("activities", {}))
-            all_keywords.update(resource_types.get("services", {}))
-
-            # Sort by keyword length (longest first) to prioritize specific phrases
-            sorted_keywords = sorted(all_keywords.items(), key=lambda x: len(x[0]), reverse=True)
-
-            for keyword, emoji in sorted_keywords:
+            for keyword, emoji in self._keywords:
                 if keyword in message_lower:
                     return emoji
 
         # 3. File extension
         if file_path:
             extension = Path(file_path).suffix.lower()
-            file_types: dict[str, str] = resource_types.get("file_types", {})
-            if extension in file_types:
-                return file_types[extension]
+            if extension in self._file_types:
+                return self._file_types[extension]
 
         # Return empty - no fallback
         return ""
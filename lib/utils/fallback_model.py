@@ -107,16 +107,15 @@ class FallbackModel:
         message = self.error_response.get("message", "An unknown error occurred")
         suggestion = self.error_response.get("suggestion", "")
 
-        formatted_message = f"❌ **{error_type.replace('_', ' ').title()}**\n\n"
-        formatted_message += f"{message}\n"
+        parts = [f"❌ **{error_type.replace('_', ' ').title()}**\n\n", f"{message}\n"]
 
         if suggestion:
-            formatted_message += f"\n💡 **Suggestion**: {suggestion}\n"
+            parts.append(f"\n💡 **Suggestion**: {suggestion}\n")
 
-        formatted_message += f"\n🤖 **Component**: {self.component_id}\n"
-        formatted_message += "🔧 **Status**: Using fallback mode to prevent crashes\n"
+        parts.append(f"\n🤖 **Component**: {self.component_id}\n")
+        parts.append("🔧 **Status**: Using fallback mode to prevent crashes\n")
 
-        return formatted_message
+        return "".join(parts)
 
     # Additional streaming methods that might be called during async operations
     async def ainvoke_stream(self, messages: str | list[dict[str, str]] | Any, **kwargs: Any) -> AsyncIterator[str]:
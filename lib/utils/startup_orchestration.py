@@ -107,11 +107,18 @@ async def initialize_knowledge_base() -> Any | None:
     Initialize CSV hot reload manager for knowledge base watching.
 
     Creates the shared knowledge base instance first, then sets up hot reload
-    to watch and update THIS SAME INSTANCE that agents will use.
+    to watch and update THIS SAME INSTANCE that agents will use. Loading the
+    CSV and embedder is blocking work, so it runs in a worker thread and the
+    event loop stays free for component discovery in the meantime.
 
     Returns:
         CSV manager instance or None if initialization failed
     """
+    return await asyncio.to_thread(_initialize_knowledge_watch)
+
+
+def _initialize_knowledge_watch() -> Any | None:
+    """Build the shared knowledge base and start its CSV watcher (blocking)."""
 
     csv_manager = None
     try:
@@ -439,7 +446,7 @@ async def orchestrated_startup(
     Startup Sequence:
     1. Database Migration (user requirement)
     2. Logging System Ready
-    3. Knowledge Base CSV Watching Init (lazy shared KB initialization)
+    3. Knowledge Base CSV Watching Init (runs in background during step 4)
     4. Component Discovery (BATCH - single filesystem scan)
     5. Version Synchronization (uses actual discovered components)
     6. Configuration Resolution
@@ -482,18 +489,25 @@ async def orchestrated_startup(
             logger.debug("📝 Logging system ready")
 
         # 3. Knowledge Base Init (CSV watching setup - shared KB initialized lazily)
+        # Started as a task so the KB load overlaps with component discovery;
+        # agents that need the KB meanwhile block on the factory lock and share it.
         csv_manager = None
+        knowledge_task = None
         if enable_knowledge_watch:
             if not quiet_mode:
                 logger.debug("Initializing knowledge base CSV watching")
             else:
                 logger.debug("Initializing knowledge base CSV watching (quiet mode)")
-            csv_manager = await initialize_knowledge_base()
+            knowledge_task = asyncio.create_task(initialize_knowledge_base())
 
         # 4. Component Discovery (Single batch operation - MOVED BEFORE version sync)
         if not quiet_mode:
             logger.debug("🔍 Discovering components")
-        registries = await batch_component_discovery()
+        try:
+            registries = await batch_component_discovery()
+        finally:
+            if knowledge_task is not None:
+                csv_manager = await knowledge_task
 
         # 5. Version Synchronization (NOW uses actual discovered registries)
         db_url = os.getenv("HIVE_DATABASE_URL")
@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 """Simple build test to validate PyPI publishing readiness."""
 
+import shutil
 import subprocess
 import sys
+import zipfile
 from pathlib import Path
 
 
 def main():
     # Clean and build
-    subprocess.run(["rm", "-rf", "dist"], check=True)
+    shutil.rmtree("dist", ignore_errors=True)
 
     subprocess.run(["uv", "build"], check=True)
 
@@ -16,46 +18,19 @@ def main():
     wheel_files = list(Path("dist").glob("*.whl"))
     list(Path("dist").glob("*.tar.gz"))
 
-    # Check wheel contents
+    # Check wheel contents in-process instead of spawning `python -m zipfile`
     if wheel_files:
         wheel_file = wheel_files[0]
-        result = subprocess.run(
-            ["uv", "run", "python", "-m", "zipfile", "-l", str(wheel_file)],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        with zipfile.ZipFile(wheel_file) as wheel:
+            names = wheel.namelist()
 
-        if "cli/" in result.stdout and "entry_points.txt" in result.stdout:
-            pass
-        else:
-            return False
-
-        # Check entry points content
-        subprocess.run(
-            [
-                "uv",
-                "run",
-                "python",
-                "-m",
-                "zipfile",
-                "-e",
-                str(wheel_file),
-                "/tmp/wheel_check",  # noqa: S108 - Test/script temp file
-            ],
-            check=True,
-        )
+            entry_points = [name for name in names if name.endswith(".dist-info/entry_points.txt")]
+            if not any(name.startswith("cli/") for name in names) or not entry_points:
+                return False
 
-        entry_file = (
-            Path("/tmp/wheel_check")  # noqa: S108 - Test/script temp file
-            / f"{wheel_file.stem}.dist-info"
-            / "entry_points.txt"
-        )
-        if entry_file.exists():
-            content = entry_file.read_text()
-            if "automagik-hive = cli.main:main" in content:
-                pass
-            else:
+            # Check entry points content
+            content = wheel.read(entry_points[0]).decode()
+            if "automagik-hive = cli.main:main" not in content:
                 return False
 
     return True
@@ -178,7 +178,7 @@ class TestStructureAnalyzer:
         if len(content.strip()) < 50:
             return False
 
-        lines = [line.strip() for line in content.split("\n") if line.strip()]
+        lines = [stripped for line in content.splitlines() if (stripped := line.strip())]
         total_lines = len(lines)
 
         if total_lines == 0:
@@ -186,7 +186,6 @@ class TestStructureAnalyzer:
 
         # Count different types of content
         import_lines = sum(1 for line in lines if line.startswith(("import ", "from ")))
-        sum(1 for line in lines if line.startswith("#"))
         constant_lines = sum(1 for line in lines if "=" in line and re.match(r"^[A-Z_][A-Z0-9_]*\s*=", line))
         function_defs = content.count("def ")
         class_defs = content.count("class ")
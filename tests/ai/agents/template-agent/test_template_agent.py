@@ -181,30 +181,31 @@ class TestTemplateAgentBehavior:
 class TestTemplateAgentFilePathHandling:
     """Test suite for file path manipulation and configuration loading."""
 
-    def test_template_agent_path_replacement_should_handle_different_paths(self):
-        """
-        FAILING TEST: Should handle various file path formats correctly.
-
-        RED phase: Tests path manipulation robustness.
-        """
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("input_path", "expected_path"),
+        [
             ("/absolute/path/to/agent.py", "/absolute/path/to/config.yaml"),
             ("relative/path/agent.py", "relative/path/config.yaml"),
             ("/complex/path/with.dots/agent.py", "/complex/path/with.dots/config.yaml"),
             ("agent.py", "config.yaml"),
-        ]
+        ],
+    )
+    def test_template_agent_path_replacement_should_handle_different_paths(self, input_path, expected_path):
+        """
+        FAILING TEST: Should handle various file path formats correctly.
 
+        RED phase: Tests path manipulation robustness.
+        """
         with patch.object(template_agent_module, "Agent") as mock_agent_class:
             mock_agent_instance = Mock()
             mock_agent_class.from_yaml.return_value = mock_agent_instance
 
-            for input_path, expected_path in test_cases:
-                with patch.object(template_agent_module, "__file__", input_path):
-                    get_template_agent()
+            with patch.object(template_agent_module, "__file__", input_path):
+                get_template_agent()
 
-                    call_args = mock_agent_class.from_yaml.call_args
-                    actual_path = call_args[0][0]
-                    assert actual_path == expected_path, f"Path replacement failed for {input_path}"
+                call_args = mock_agent_class.from_yaml.call_args
+                actual_path = call_args[0][0]
+                assert actual_path == expected_path, f"Path replacement failed for {input_path}"
 
     def test_template_agent_should_handle_missing_file_attribute(self):
         """
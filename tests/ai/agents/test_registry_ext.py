@@ -190,6 +190,25 @@ class TestAgentRegistry:
             expected = {"agent1": mock_agent1, "agent2": mock_agent2}
             assert result == expected
 
+    @pytest.mark.asyncio
+    async def test_get_all_agents_discovers_once(self):
+        """Test get_all_agents scans agent configs once for all of its lookups."""
+        from ai.agents.registry import AgentRegistry
+
+        with (
+            patch("ai.agents.registry._discover_agents", return_value=["agent1", "agent2"]) as mock_discover,
+            patch("ai.agents.registry.create_agent", new_callable=AsyncMock) as mock_create,
+        ):
+            result = await AgentRegistry.get_all_agents()
+
+            assert set(result) == {"agent1", "agent2"}
+            assert mock_create.await_count == 2
+            mock_discover.assert_called_once()
+
+            # Lookups outside get_all_agents still see newly added agents
+            AgentRegistry.list_available_agents()
+            assert mock_discover.call_count == 2
+
     @pytest.mark.asyncio
     async def test_get_all_agents_with_failures(self):
         """Test get_all_agents with some agent loading failures."""
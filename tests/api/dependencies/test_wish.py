@@ -0,0 +1,96 @@
+"""Tests for the Genie wish catalog dependency."""
+
+import concurrent.futures
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+from api.dependencies.wish import _WISH_CACHE, _parse_wish_file, get_wish_catalog
+
+
+class TestParseWishFile:
+    """Test suite for wish document parsing."""
+
+    def test_title_and_status_extracted(self, tmp_path: Path):
+        """Test the first heading and status line are used."""
+        wish = tmp_path / "genie" / "wishes" / "demo-wish.md"
+        wish.parent.mkdir(parents=True)
+        wish.write_text("intro\n# Demo Wish\n**Status:** APPROVED\n# Later Heading\n**Status:** DONE\n")
+
+        metadata = _parse_wish_file(wish, tmp_path)
+
+        assert metadata.id == "demo-wish"
+        assert metadata.title == "Demo Wish"
+        assert metadata.status == "APPROVED"
+        assert metadata.path == str(Path("genie/wishes/demo-wish.md"))
+
+    def test_defaults_when_header_missing(self, tmp_path: Path):
+        """Test missing title and status fall back to defaults."""
+        wish = tmp_path / "api-configuration-wish.md"
+        wish.write_text("no structured header here\n")
+
+        metadata = _parse_wish_file(wish, tmp_path)
+
+        assert metadata.title == "Api Configuration Wish"
+        assert metadata.status == "UNKNOWN"
+
+
+class TestWishCatalog:
+    """Test suite for the cached wish catalog."""
+
+    def test_unchanged_wishes_not_reparsed(self, tmp_path: Path):
+        """Test wishes are parsed again only after they change or disappear."""
+        wishes_dir = tmp_path / "genie" / "wishes"
+        wishes_dir.mkdir(parents=True)
+        wish = wishes_dir / "demo-wish.md"
+        wish.write_text("# Demo\n**Status:** DRAFT\n")
+
+        with (
+            patch("api.dependencies.wish.settings") as mock_settings,
+            patch("api.dependencies.wish._parse_wish_file", wraps=_parse_wish_file) as mock_parse,
+        ):
+            mock_settings.return_value.project_root = tmp_path
+
+            assert [w.status for w in get_wish_catalog()] == ["DRAFT"]
+            assert [w.status for w in get_wish_catalog()] == ["DRAFT"]
+            assert mock_parse.call_count == 1
+
+            wish.write_text("# Demo\n**Status:** APPROVED\n")
+            assert [w.status for w in get_wish_catalog()] == ["APPROVED"]
+            assert mock_parse.call_count == 2
+
+            wish.unlink()
+            assert get_wish_catalog() == []
+            assert (wish, tmp_path) not in _WISH_CACHE
+
+    def test_concurrent_requests_prune_stale_entries_once(self, tmp_path: Path):
+        """Test two requests pruning the same stale entry do not both try to delete it."""
+        barrier = threading.Barrier(2)
+
+        class RendezvousKey:
+            """Stale cache key whose hashing lines both requests up on the same prune step."""
+
+            def __hash__(self):
+                try:
+                    barrier.wait(timeout=0.5)
+                except threading.BrokenBarrierError:
+                    pass
+                return 0
+
+        wishes_dir = tmp_path / "genie" / "wishes"
+        wishes_dir.mkdir(parents=True)
+        (wishes_dir / "demo-wish.md").write_text("# Demo\n**Status:** DRAFT\n")
+        _WISH_CACHE[RendezvousKey()] = ((0, 0), None)
+        # Seeding hashed the key alone and broke the barrier; re-arm it for the two requests
+        barrier.reset()
+
+        try:
+            with patch("api.dependencies.wish.settings") as mock_settings:
+                mock_settings.return_value.project_root = tmp_path
+                with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                    catalogs = list(executor.map(lambda _: get_wish_catalog(), range(2)))
+
+            assert [[w.status for w in catalog] for catalog in catalogs] == [["DRAFT"], ["DRAFT"]]
+            assert list(_WISH_CACHE) == [(wishes_dir / "demo-wish.md", tmp_path)]
+        finally:
+            _WISH_CACHE.clear()
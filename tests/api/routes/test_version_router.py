@@ -5,6 +5,8 @@ Tests all version management endpoints including component versioning,
 execution, activation, and history tracking.
 """
 
+import asyncio
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -138,6 +140,35 @@ class TestVersionExecution:
 
                 assert response.status_code == status.HTTP_200_OK
 
+    def test_execute_versioned_component_runs_off_event_loop(
+        self,
+        test_client,
+        api_headers,
+        sample_execution_request,
+    ):
+        """Test the blocking agent run is dispatched to a worker thread."""
+        calling_threads = []
+
+        def fake_run(component, message, context):
+            calling_threads.append(threading.current_thread())
+            mock_response = Mock()
+            mock_response.content = "Threaded response"
+            return mock_response
+
+        with patch("lib.utils.message_validation.validate_agent_message"):
+            with patch("lib.utils.message_validation.safe_agent_run", side_effect=fake_run):
+                with patch("api.routes.version_router.asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+                    response = test_client.post(
+                        "/api/v1/version/execute",
+                        json=sample_execution_request,
+                        headers=api_headers,
+                    )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["response"] == "Threaded response"
+        mock_to_thread.assert_called_once()
+        assert len(calling_threads) == 1
+
 
 class TestVersionManagement:
     """Test suite for version management endpoints."""
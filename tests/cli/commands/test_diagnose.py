@@ -387,6 +387,32 @@ HIVE_API_KEY=hive_1234567890abcdef1234567890abcdef
         result = diagnose_commands.diagnose_installation()
         assert result is False
 
+    def test_diagnose_installation_reports_in_check_order(self, diagnose_commands, capsys):
+        """Test concurrent checks are still reported in their declared order."""
+        import time
+
+        def slow_workspace_check():
+            time.sleep(0.05)
+            return ("Workspace Structure", True, [])
+
+        with (
+            patch.object(diagnose_commands, "_check_workspace_structure", slow_workspace_check),
+            patch("subprocess.run", return_value=MagicMock(returncode=1, stdout="")),
+        ):
+            diagnose_commands.diagnose_installation()
+
+        output = capsys.readouterr().out
+        positions = [
+            output.index(name)
+            for name in (
+                "Workspace Structure",
+                "Docker Configuration",
+                "Docker Daemon",
+                "PostgreSQL Status",
+            )
+        ]
+        assert positions == sorted(positions)
+
     def test_diagnose_installation_shows_all_issues(self, diagnose_commands):
         """Test diagnose_installation shows all issues, not just first."""
         with patch("builtins.print") as mock_print:
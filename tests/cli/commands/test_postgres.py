@@ -147,6 +147,74 @@ class TestPostgreSQLServiceLifecycle:
                 postgres_cmd.postgres_start("/test/workspace")
 
 
+class TestPostgreSQLReadinessWait:
+    """Test the PostgreSQL readiness poll that replaced fixed startup sleeps."""
+
+    def test_returns_as_soon_as_postgres_accepts_connections(self):
+        """Polling stops on the first ready check instead of sleeping the full budget."""
+        from cli.docker_manager import DockerManager
+
+        manager = DockerManager()
+        with (
+            patch.object(manager, "_postgres_ready", side_effect=[False, False, True]),
+            patch("time.sleep") as mock_sleep,
+        ):
+            assert manager._wait_for_postgres("hive-postgres", timeout=8.0) is True
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.05, 0.1]
+
+    def test_gives_up_after_timeout(self):
+        """A database that never becomes ready is reported after the sleep budget is spent."""
+        from cli.docker_manager import DockerManager
+
+        manager = DockerManager()
+        with (
+            patch.object(manager, "_postgres_ready", return_value=False),
+            patch("time.sleep") as mock_sleep,
+        ):
+            assert manager._wait_for_postgres("hive-postgres", timeout=2.0) is False
+
+        assert sum(c.args[0] for c in mock_sleep.call_args_list) >= 2.0
+
+    def test_running_container_is_not_ready_until_pg_isready_succeeds(self, capsys):
+        """A running container whose server is still starting keeps the poll waiting, quietly."""
+        from cli.docker_manager import DockerManager
+
+        manager = DockerManager()
+        pg_isready_results = [
+            subprocess.CompletedProcess([], 1, "", "Error response from daemon: container is restarting"),
+            subprocess.CompletedProcess([], 2, "localhost:5432 - no response\n", ""),
+            subprocess.CompletedProcess([], 0, "localhost:5432 - accepting connections\n", ""),
+        ]
+        with (
+            patch.object(manager, "_container_running", return_value=True),
+            patch("cli.docker_manager.subprocess.run", side_effect=pg_isready_results) as mock_run,
+            patch("time.sleep") as mock_sleep,
+        ):
+            assert manager._wait_for_postgres("hive-postgres", timeout=8.0) is True
+
+        assert mock_run.call_count == 3
+        assert mock_run.call_args.args[0][:4] == ["docker", "exec", "hive-postgres", "pg_isready"]
+        assert mock_sleep.call_count == 2
+        assert capsys.readouterr().out == ""
+
+    @patch("builtins.print")
+    @patch("cli.commands.postgres.DockerManager")
+    def test_restart_does_not_claim_connections_before_ready(self, mock_docker_manager_class, mock_print):
+        """Restart reports a still-starting server instead of claiming it accepts connections."""
+        mock_docker_manager = Mock()
+        mock_docker_manager_class.return_value = mock_docker_manager
+        mock_docker_manager._container_exists.return_value = True
+        mock_docker_manager._run_command.return_value = None
+        mock_docker_manager._wait_for_postgres.return_value = False
+
+        assert PostgreSQLCommands().postgres_restart("/test/workspace") is True
+
+        printed = [c.args[0] for c in mock_print.call_args_list]
+        assert "✅ PostgreSQL is now accepting connections" not in printed
+        assert "⏳ PostgreSQL is still starting up and not accepting connections yet" in printed
+
+
 class TestPostgreSQLServiceStatus:
     """Test PostgreSQL status and health monitoring."""
 
@@ -417,6 +417,20 @@ class TestMainServiceOperations:
 
             assert result is True
 
+    def test_serve_main_starts_only_stopped_service(self, temp_workspace):
+        """Test serve main leaves a running postgres alone and only brings up the app."""
+        with (
+            patch.object(MainService, "_validate_main_environment", return_value=True),
+            patch.object(
+                MainService, "get_main_status", return_value={"hive-postgres": "✅ Running", "hive-api": "🛑 Stopped"}
+            ),
+            patch.object(MainService, "_setup_main_containers", return_value=True) as mock_setup,
+        ):
+            service = MainService(temp_workspace)
+            assert service.serve_main(str(temp_workspace)) is True
+
+        mock_setup.assert_called_once_with(str(temp_workspace), services=("app",))
+
 
 class TestMainServiceStopRestart:
     """Test main service stop and restart operations."""
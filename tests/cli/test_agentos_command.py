@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import json
+from pathlib import Path
 
-from cli.commands.service import ServiceManager
+import pytest
+
+from cli.commands.service import ServiceManager, _agentos_cache_path, _agentos_fingerprint
 from lib.agentos.exceptions import AgentOSConfigError
 
 
+@pytest.fixture(autouse=True)
+def isolated_agentos_cache(tmp_path, monkeypatch):
+    """Keep the on-disk AgentOS payload cache inside the test sandbox."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return _agentos_cache_path()
+
+
 class TestServiceManagerAgentOSConfig:
     """Ensure CLI entry point surfaces AgentOS configuration cleanly."""
 
@@ -75,3 +85,113 @@ class TestServiceManagerAgentOSConfig:
 
         assert success is True
         assert json.loads(output) == payload
+
+
+class TestAgentOSPayloadCache:
+    """Ensure the serialized AgentOS payload is reused while inputs are unchanged."""
+
+    @staticmethod
+    def _counting_service(monkeypatch, payload):
+        calls = []
+
+        class CountingService:
+            def serialize(self) -> dict[str, object]:
+                calls.append(1)
+                return payload
+
+        monkeypatch.setattr("lib.services.agentos_service.AgentOSService", CountingService)
+        return calls
+
+    def test_reuses_cached_payload_for_matching_fingerprint(self, monkeypatch, isolated_agentos_cache):
+        """Second invocation should read the cache instead of serializing again."""
+        payload = {"os_id": "cached-os", "agents": []}
+        calls = self._counting_service(monkeypatch, payload)
+        monkeypatch.setattr("cli.commands.service._agentos_fingerprint", lambda: "fp-1")
+
+        manager = ServiceManager()
+        assert manager._cached_agentos_payload() == payload
+        assert manager._cached_agentos_payload() == payload
+
+        assert len(calls) == 1
+        assert json.loads(isolated_agentos_cache.read_text())["fingerprint"] == "fp-1"
+
+    def test_recomputes_when_fingerprint_changes(self, monkeypatch):
+        """A changed fingerprint should invalidate the cached payload."""
+        calls = self._counting_service(monkeypatch, {"os_id": "fresh-os"})
+        manager = ServiceManager()
+
+        monkeypatch.setattr("cli.commands.service._agentos_fingerprint", lambda: "fp-1")
+        manager._cached_agentos_payload()
+        monkeypatch.setattr("cli.commands.service._agentos_fingerprint", lambda: "fp-2")
+        manager._cached_agentos_payload()
+
+        assert len(calls) == 2
+
+    def test_skips_cache_without_fingerprint(self, monkeypatch, isolated_agentos_cache):
+        """Without a fingerprint the payload is always rebuilt and never written."""
+        calls = self._counting_service(monkeypatch, {"os_id": "uncached-os"})
+        monkeypatch.setattr("cli.commands.service._agentos_fingerprint", lambda: None)
+
+        manager = ServiceManager()
+        manager._cached_agentos_payload()
+        manager._cached_agentos_payload()
+
+        assert len(calls) == 2
+        assert not isolated_agentos_cache.exists()
+
+    def test_failed_cache_write_leaves_no_temp_file(self, monkeypatch, isolated_agentos_cache):
+        """A write that fails partway should not strand its temp file in the cache directory."""
+        payload = {"os_id": "fresh-os"}
+        self._counting_service(monkeypatch, payload)
+        monkeypatch.setattr("cli.commands.service._agentos_fingerprint", lambda: "fp-1")
+        original_write_text = Path.write_text
+
+        def disk_full(self, data, *args, **kwargs):
+            original_write_text(self, data[:10], *args, **kwargs)
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr(Path, "write_text", disk_full)
+
+        assert ServiceManager()._cached_agentos_payload() == payload
+        assert list(isolated_agentos_cache.parent.iterdir()) == []
+
+    @pytest.mark.parametrize(
+        "builder",
+        ["lib/agentos/config_loader.py", "lib/agentos/config_models.py", "lib/services/agentos_service.py"],
+    )
+    def test_fingerprint_tracks_builder_modules(self, monkeypatch, tmp_path, builder):
+        """Editing any module that builds the payload should invalidate the cached copy."""
+        project_root = tmp_path / "project"
+        source = project_root / builder
+        source.parent.mkdir(parents=True)
+        source.write_text("# v1\n")
+        monkeypatch.setattr("cli.commands.service._PROJECT_ROOT", project_root)
+
+        before = _agentos_fingerprint()
+        source.write_text("# v2 with a longer body\n")
+
+        assert before is not None
+        assert _agentos_fingerprint() != before
+
+
+class TestAgentOSSummary:
+    """Ensure the terminal summary previews long sections and tolerates missing ones."""
+
+    def test_sections_keep_preview_and_hidden_count(self, capsys):
+        """Only the preview rows are printed; totals are preserved."""
+        ServiceManager()._print_agentos_summary(
+            {
+                "agents": [{"id": f"agent-{i}"} for i in range(8)],
+                "teams": None,
+                "interfaces": [{"type": "playground"}],
+            }
+        )
+
+        output = capsys.readouterr().out
+        assert "OS ID: unknown" in output
+        assert "🤖 Agents (8):" in output
+        assert "  - agent-0 (agent-0)" in output
+        assert "agent-5" not in output
+        assert "  ... and 3 more" in output
+        assert "Teams" not in output
+        assert "  - playground: —" in output
@@ -1,9 +1,13 @@
 """Tests for common.notifications module."""
 
+import asyncio
 import os
 import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import anyio
 import pytest
 
 from common.notifications import (
@@ -125,6 +129,16 @@ class TestWhatsAppProvider:
         provider = WhatsAppProvider()
         assert provider.group_id is None
 
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("true", True), ("TRUE", True), ("1", True), ("yes", True), ("false", False), ("", False)],
+    )
+    def test_whatsapp_provider_enabled_resolved_at_init(self, value, expected):
+        """Test the enable toggle is read once from the environment at construction."""
+        with patch.dict(os.environ, {"HIVE_WHATSAPP_NOTIFICATIONS_ENABLED": value}):
+            provider = WhatsAppProvider()
+        assert provider.enabled is expected
+
     def test_whatsapp_provider_cooldown_initialization(self):
         """Test WhatsAppProvider initializes cooldown properly."""
         provider = WhatsAppProvider()
@@ -173,10 +187,81 @@ class TestWhatsAppProvider:
         result = await provider.send(message)
         assert result is True  # Returns True because it logs as fallback
 
+    @patch("lib.mcp.get_mcp_tools")
+    @patch.dict(os.environ, {"HIVE_WHATSAPP_NOTIFICATIONS_ENABLED": "true"})
+    @pytest.mark.asyncio
+    async def test_whatsapp_send_reuses_mcp_session(self, mock_get_mcp_tools):
+        """Test WhatsApp sends share one MCP session until closed."""
+        mock_tools = AsyncMock()
+        mock_tool_function = AsyncMock()
+        mock_tool_function.entrypoint = AsyncMock(return_value={"status": "sent"})
+        mock_tools.functions = {"send_text_message": mock_tool_function}
+        mock_get_mcp_tools.return_value.__aenter__.return_value = mock_tools
+
+        provider = WhatsAppProvider(group_id="test_group")
+        for title in ("First", "Second"):
+            message = NotificationMessage(title=title, message="msg", level=NotificationLevel.INFO, source="test")
+            assert await provider.send(message) is True
+
+        mock_get_mcp_tools.assert_called_once_with("whatsapp_notifications")
+        assert mock_tool_function.entrypoint.await_count == 2
+
+        await provider.aclose()
+        mock_get_mcp_tools.return_value.__aexit__.assert_awaited_once()
+        assert provider._session_task is None
+
+    @patch("lib.mcp.get_mcp_tools")
+    @pytest.mark.asyncio
+    async def test_whatsapp_send_via_mcp_resets_session_on_failure(self, mock_get_mcp_tools):
+        """Test a failed MCP delivery closes the shared session so the next send reconnects."""
+        mock_tools = AsyncMock()
+        mock_tool_function = AsyncMock()
+        mock_tool_function.entrypoint = AsyncMock(side_effect=RuntimeError("transport closed"))
+        mock_tools.functions = {"send_text_message": mock_tool_function}
+        mock_get_mcp_tools.return_value.__aenter__.return_value = mock_tools
+
+        provider = WhatsAppProvider(group_id="test_group")
+
+        with pytest.raises(RuntimeError):
+            await provider._send_via_mcp("hello")
+
+        mock_tool_function.entrypoint.assert_awaited_once_with(
+            None, instance="SofIA", message="hello", number="test_group"
+        )
+        mock_get_mcp_tools.return_value.__aexit__.assert_awaited_once()
+        assert provider._session_task.done()
+
+    @patch.dict(os.environ, {"HIVE_WHATSAPP_NOTIFICATIONS_ENABLED": "true"})
+    @pytest.mark.asyncio
+    async def test_whatsapp_session_closed_by_owning_task(self):
+        """Test a session opened from one task can be closed from another without leaking it."""
+        mock_tool_function = AsyncMock()
+        mock_tool_function.entrypoint = AsyncMock(return_value={"status": "sent"})
+        exits = []
+
+        @asynccontextmanager
+        async def fake_mcp_tools(server_name):
+            # anyio cancel scopes must be exited by the task that entered them, like MCPTools
+            with anyio.CancelScope():
+                yield SimpleNamespace(functions={"send_text_message": mock_tool_function})
+            exits.append(server_name)
+
+        provider = WhatsAppProvider(group_id="test_group")
+        message = NotificationMessage(title="Test", message="msg", level=NotificationLevel.INFO, source="test")
+
+        with patch("lib.mcp.get_mcp_tools", side_effect=fake_mcp_tools):
+            # Mirrors startup_notifications.isolated_send: the first send runs in a short-lived task
+            assert await asyncio.create_task(provider.send(message)) is True
+            await asyncio.create_task(provider.aclose())
+
+        assert exits == ["whatsapp_notifications"]
+        mock_tool_function.entrypoint.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_whatsapp_send_cooldown(self):
         """Test WhatsApp sending respects cooldown."""
-        provider = WhatsAppProvider()
+        with patch.dict(os.environ, {"HIVE_WHATSAPP_NOTIFICATIONS_ENABLED": "true"}):
+            provider = WhatsAppProvider()
         message = NotificationMessage(
             title="Test", message="Test message", level=NotificationLevel.WARNING, source="test"
         )
@@ -185,8 +270,7 @@ class TestWhatsAppProvider:
         cooldown_key = f"{message.source}:{message.level}:{message.title}"
         provider._last_notification[cooldown_key] = time.time()
 
-        with patch.dict(os.environ, {"HIVE_WHATSAPP_NOTIFICATIONS_ENABLED": "true"}):
-            result = await provider.send(message)
+        result = await provider.send(message)
 
         assert result is False
 
@@ -199,6 +283,15 @@ class TestWhatsAppProvider:
         assert provider._get_emoji(NotificationLevel.CRITICAL) == "🚨"
         assert provider._get_emoji(NotificationLevel.ERROR) == "❌"
 
+    def test_level_lookup_tables_are_read_only(self):
+        """Test the shared level lookup tables cannot be mutated."""
+        from common import notifications
+
+        with pytest.raises(TypeError):
+            notifications._LEVEL_EMOJI[NotificationLevel.INFO] = "x"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            notifications._LOG_METHOD_NAMES[NotificationLevel.INFO] = "x"  # type: ignore[index]
+
     def test_whatsapp_provider_is_available(self):
         """Test WhatsApp provider availability check."""
         provider = WhatsAppProvider()
@@ -397,6 +490,25 @@ class TestNotificationService:
         assert call_args.source == "test_source"
         assert call_args.level == NotificationLevel.WARNING
 
+    @pytest.mark.asyncio
+    async def test_notification_service_send_batch(self):
+        """Test NotificationService sends a batch concurrently and reports per-message results."""
+        service = NotificationService()
+        mock_provider = AsyncMock()
+        mock_provider.is_available = MagicMock(return_value=True)
+        mock_provider.send.side_effect = [True, Exception("boom"), False]
+        service.providers["log"] = mock_provider
+        service.default_provider = "log"
+
+        messages = [
+            NotificationMessage(title=f"Test {i}", message="msg", level=NotificationLevel.INFO, source="test")
+            for i in range(3)
+        ]
+
+        results = await service.send_batch(messages)
+        assert results == [True, False, False]
+        assert mock_provider.send.call_count == 3
+
     def test_notification_service_get_available_providers(self):
         """Test NotificationService get_available_providers."""
         service = NotificationService()
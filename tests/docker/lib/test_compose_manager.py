@@ -0,0 +1,107 @@
+"""Tests for DockerComposeManager batched service status parsing."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from docker.lib.compose_manager import DockerComposeManager, ServiceStatus
+
+# Captured `docker compose ps --format json` output from compose v2.21+ (one object per line)
+NDJSON_OUTPUT = (
+    '{"Command":"\\"docker-entrypoint.s…\\"","ExitCode":0,"Health":"healthy","ID":"3f1c2a","Image":"agnohq/pgvector:16",'
+    '"Name":"hive-postgres","Names":"hive-postgres","Ports":"0.0.0.0:5532->5432/tcp","Project":"main",'
+    '"Service":"postgres","State":"running","Status":"Up 2 hours (healthy)"}\n'
+    '{"Command":"\\"uvicorn api.serve…\\"","ExitCode":0,"Health":"","ID":"9b7e4d","Image":"main-app",'
+    '"Name":"hive-api","Names":"hive-api","Ports":"0.0.0.0:8886->8886/tcp","Project":"main",'
+    '"Service":"app","State":"restarting","Status":"Restarting (1) 3 seconds ago"}\n'
+)
+
+# Captured output from compose v2.0-v2.20, which prints a single JSON array
+ARRAY_OUTPUT = (
+    '[{"ID":"3f1c2a","Name":"hive-postgres","Command":"docker-entrypoint.sh postgres","Project":"main",'
+    '"Service":"postgres","State":"running","Health":"healthy","ExitCode":0,'
+    '"Publishers":[{"URL":"0.0.0.0","TargetPort":5432,"PublishedPort":5532,"Protocol":"tcp"}]},'
+    '{"ID":"9b7e4d","Name":"hive-api","Command":"uvicorn api.serve:app","Project":"main",'
+    '"Service":"app","State":"paused","Health":"","ExitCode":0,"Publishers":[]}]'
+)
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> DockerComposeManager:
+    (tmp_path / "docker-compose.yml").write_text("services:\n  postgres:\n    image: pg\n  app:\n    build: .\n")
+    compose = DockerComposeManager()
+    compose._compose_cmd = ["docker", "compose"]
+    return compose
+
+
+def _ps_result(stdout: str, returncode: int = 0) -> Mock:
+    return Mock(returncode=returncode, stdout=stdout, stderr="")
+
+
+class TestGetAllServiceStatuses:
+    def test_parses_line_delimited_output(self, manager, tmp_path):
+        with patch("subprocess.run", return_value=_ps_result(NDJSON_OUTPUT)) as mock_run:
+            statuses = manager.get_all_service_statuses(str(tmp_path))
+
+        assert statuses == {"postgres": ServiceStatus.RUNNING, "app": ServiceStatus.RESTARTING}
+        # Same listing as the per-service `ps <service>` query: no --all, so stopped services stay absent
+        assert mock_run.call_args.args[0][-3:] == ["ps", "--format", "json"]
+
+    def test_parses_array_output(self, manager, tmp_path):
+        with patch("subprocess.run", return_value=_ps_result(ARRAY_OUTPUT)):
+            statuses = manager.get_all_service_statuses(str(tmp_path))
+
+        assert statuses == {"postgres": ServiceStatus.RUNNING, "app": ServiceStatus.PAUSED}
+
+    def test_unknown_state_maps_to_stopped(self, manager, tmp_path):
+        output = '{"Service":"postgres","State":"created"}\n{"Service":"app"}\n'
+        with patch("subprocess.run", return_value=_ps_result(output)):
+            statuses = manager.get_all_service_statuses(str(tmp_path))
+
+        assert statuses == {"postgres": ServiceStatus.STOPPED, "app": ServiceStatus.STOPPED}
+
+    def test_no_listed_containers_is_empty(self, manager, tmp_path):
+        with patch("subprocess.run", return_value=_ps_result("")):
+            assert manager.get_all_service_statuses(str(tmp_path)) == {}
+
+    @pytest.mark.parametrize(
+        "run_kwargs",
+        [
+            {"return_value": _ps_result("", returncode=1)},
+            {"return_value": _ps_result("NAME   IMAGE   STATUS\n")},
+            {"return_value": _ps_result('{"State":"running"}\n')},
+            {"side_effect": subprocess.TimeoutExpired(cmd="docker", timeout=10)},
+        ],
+        ids=["legacy-compose-error", "table-output", "missing-service-key", "timeout"],
+    )
+    def test_unavailable_query_returns_none(self, manager, tmp_path, run_kwargs):
+        with patch("subprocess.run", **run_kwargs):
+            assert manager.get_all_service_statuses(str(tmp_path)) is None
+
+    def test_missing_compose_file_returns_none(self, tmp_path):
+        assert DockerComposeManager().get_all_service_statuses(str(tmp_path)) is None
+
+
+class TestGetAllServicesStatus:
+    def test_unlisted_service_reads_as_not_exists(self, manager, tmp_path):
+        with patch.object(manager, "get_all_service_statuses", return_value={"postgres": ServiceStatus.RUNNING}):
+            services = manager.get_all_services_status(str(tmp_path))
+
+        assert services["postgres"].status == ServiceStatus.RUNNING
+        assert services["app"].status == ServiceStatus.NOT_EXISTS
+        assert services["app"].image == "built:app"
+
+    def test_falls_back_to_per_service_queries(self, manager, tmp_path):
+        with (
+            patch.object(manager, "get_all_service_statuses", return_value=None),
+            patch.object(manager, "get_service_status", return_value=ServiceStatus.EXITED) as mock_single,
+        ):
+            services = manager.get_all_services_status(str(tmp_path))
+
+        assert {name: info.status for name, info in services.items()} == {
+            "postgres": ServiceStatus.EXITED,
+            "app": ServiceStatus.EXITED,
+        }
+        assert mock_single.call_count == 2
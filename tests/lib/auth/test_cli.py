@@ -25,6 +25,30 @@ class TestCli:
         # Add specific attribute tests as needed
         assert hasattr(lib.auth.cli, "__doc__")
 
+    def test_auth_action_dispatch_table(self):
+        """Test auth actions map to their handlers."""
+        import lib.auth.cli as cli
+
+        assert cli._AUTH_ACTIONS == {
+            "show": cli.show_current_key,
+            "regenerate": cli.regenerate_key,
+            "status": cli.show_auth_status,
+        }
+
+    def test_credential_action_dispatch_table(self):
+        """Test credential actions forward parsed arguments to their handlers."""
+        from argparse import Namespace
+        from unittest.mock import patch
+
+        import lib.auth.cli as cli
+
+        assert set(cli._CREDENTIAL_ACTIONS) == {"postgres", "agent", "workspace", "status", "sync-mcp"}
+
+        with patch.object(cli, "generate_agent_credentials") as mock_generate:
+            cli._CREDENTIAL_ACTIONS["agent"](Namespace(port=35532, database="hive_agent", env_file=None))
+
+        mock_generate.assert_called_once_with(port=35532, database="hive_agent", env_file=None)
+
     @pytest.mark.skip(reason="Placeholder test - implement based on actual module functionality")
     def test_placeholder_functionality(self):
         """Placeholder test for main functionality."""
@@ -1212,6 +1212,8 @@ class TestDockerContainerManagement:
             assert containers["hive-postgres"] is True
             assert containers.get("hive-api", False) is True
             mock_logger.info.assert_called_once()
+            # A single `docker ps` covers every managed container
+            mock_run.assert_called_once()
 
     @patch("subprocess.run")
     def test_detect_existing_containers_not_running(self, mock_run):
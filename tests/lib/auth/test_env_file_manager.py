@@ -6,11 +6,12 @@ Focused unit tests for EnvFileManager covering:
 - Error handling paths for read/update
 """
 
+import os
 from pathlib import Path
 
 import pytest
 
-from lib.auth.env_file_manager import EnvFileManager
+from lib.auth.env_file_manager import EnvFileManager, write_env_atomic
 
 
 class TestEnvFileResolution:
@@ -86,6 +87,65 @@ class TestValueUpdates:
         lines = (tmp_path / ".env").read_text().splitlines()
         assert any(line == "HIVE_API_KEY=hive_abc" for line in lines)
 
+    def test_update_values_syncs_alias_without_rereading(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        (tmp_path / ".env").write_text("HIVE_API_KEY=old\nHIVE_API_PORT=8886\n")
+        mgr = EnvFileManager(project_root=tmp_path)
+        reads: list[Path] = []
+        original_read = Path.read_text
+
+        def tracking_read(self, *args, **kwargs):
+            reads.append(self)
+            return original_read(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", tracking_read)
+        assert mgr.update_values({"HIVE_API_KEY": "new", "HIVE_API_PORT": "9999"}) is True
+
+        assert reads == [tmp_path / ".env"]
+        assert (tmp_path / ".env.master").read_text() == "HIVE_API_KEY=new\nHIVE_API_PORT=9999\n"
+
+    def test_update_values_replaces_file_atomically(self, tmp_path: Path):
+        env_file = tmp_path / ".env"
+        env_file.write_text("HIVE_API_KEY=old\n")
+        env_file.chmod(0o600)
+        mgr = EnvFileManager(project_root=tmp_path)
+
+        assert mgr.update_values({"HIVE_API_KEY": "new"}) is True
+
+        assert env_file.read_text() == "HIVE_API_KEY=new\n"
+        assert env_file.stat().st_mode & 0o777 == 0o600
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_update_values_refuses_read_only_env(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        env_file = tmp_path / ".env"
+        env_file.write_text("HIVE_API_KEY=old\n")
+        env_file.chmod(0o444)
+        mgr = EnvFileManager(project_root=tmp_path)
+        # Root bypasses file modes, so report the access check a regular user would get
+        monkeypatch.setattr(os, "access", lambda path, mode: False)
+
+        with pytest.raises(PermissionError):
+            mgr.update_values({"HIVE_API_KEY": "new"})
+
+        assert env_file.read_text() == "HIVE_API_KEY=old\n"
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_write_env_atomic_never_exposes_content(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        env_file = tmp_path / ".env"
+        env_file.write_text("HIVE_API_KEY=old\n")
+        env_file.chmod(0o600)
+        modes: list[int] = []
+        original_replace = os.replace
+
+        def tracking_replace(src, dst):
+            modes.append(Path(src).stat().st_mode & 0o777)
+            original_replace(src, dst)
+
+        monkeypatch.setattr(os, "replace", tracking_replace)
+        write_env_atomic(env_file, "HIVE_API_KEY=secret\n")
+
+        assert modes == [0o600]
+        assert env_file.read_text() == "HIVE_API_KEY=secret\n"
+
     def test_update_values_fails_when_create_disabled(self, tmp_path: Path):
         mgr = EnvFileManager(project_root=tmp_path)
         ok = mgr.update_values({"HIVE_API_KEY": "hive_abc"}, create_if_missing=False)
@@ -140,6 +200,39 @@ class TestExtractionHelpers:
         api = mgr.extract_api_key("HIVE_API_KEY")
         assert api == "hive_k"
 
+    def test_extraction_ignores_comments_and_later_duplicates(self, tmp_path: Path):
+        (tmp_path / ".env").write_text(
+            "# HIVE_API_KEY=commented\nHIVE_API_KEY=\nHIVE_API_KEY=hive_first\nHIVE_API_KEY=hive_second\n"
+            "HIVE_DATABASE_URL=postgresql+psycopg://u:p@localhost:6001/db\n"
+        )
+        mgr = EnvFileManager(project_root=tmp_path)
+
+        assert mgr.extract_api_key("HIVE_API_KEY") == "hive_first"
+        assert mgr.extract_postgres_credentials("HIVE_DATABASE_URL")["port"] == "6001"
+
+    def test_extract_base_ports_lets_later_definitions_win(self, tmp_path: Path):
+        (tmp_path / ".env").write_text(
+            "HIVE_DATABASE_URL=postgresql+psycopg://u:p@localhost:5701/hive\n"
+            "HIVE_API_PORT=9001\n"
+            "HIVE_DATABASE_URL=postgresql+psycopg://u:p@localhost:5702/hive\n"
+            "HIVE_API_PORT=9002\n"
+            "HIVE_API_PORT=not-a-port\n"
+        )
+        mgr = EnvFileManager(project_root=tmp_path)
+
+        ports = mgr.extract_base_ports({"db": 5532, "api": 8886}, "HIVE_DATABASE_URL", "HIVE_API_PORT")
+        assert ports == {"db": 5702, "api": 9002}
+
+    def test_extract_postgres_credentials_uses_first_definition(self, tmp_path: Path):
+        (tmp_path / ".env").write_text(
+            "HIVE_DATABASE_URL=\nHIVE_DATABASE_URL=postgresql+psycopg://u:p@localhost:6002/db\n"
+        )
+        mgr = EnvFileManager(project_root=tmp_path)
+
+        creds = mgr.extract_postgres_credentials("HIVE_DATABASE_URL")
+        assert creds["url"] == ""
+        assert creds["port"] is None
+
 
 class TestErrorHandling:
     def test_read_master_lines_ioerror_returns_empty(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
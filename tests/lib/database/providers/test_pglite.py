@@ -1,5 +1,6 @@
 """Tests for PGlite database backend."""
 
+import io
 import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
@@ -11,7 +12,7 @@ project_root = Path(__file__).parent.parent.parent.parent.parent.absolute()
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from lib.database.providers.pglite import PGliteBackend  # noqa: E402
+from lib.database.providers.pglite import PGliteBackend, _drain_bridge_output  # noqa: E402
 
 
 class TestPGliteBackend:
@@ -23,6 +24,7 @@ class TestPGliteBackend:
         with patch("lib.database.providers.pglite.subprocess.Popen") as mock_popen:
             mock_process = Mock()
             mock_process.poll.return_value = None
+            mock_process.stdout.read1.return_value = b""
             mock_popen.return_value = mock_process
             yield mock_popen
 
@@ -272,3 +274,14 @@ class TestPGliteBackend:
         assert isinstance(kwargs["json"]["params"], list)
 
         await backend.close()
+
+    def test_bridge_output_drained_in_chunks(self):
+        """Test bridge output is split into log lines across chunk boundaries."""
+        stream = io.BytesIO(b"[PGlite Bridge] starting\n\n[PGlite Bridge] ready\npartial")
+
+        with patch("lib.database.providers.pglite.logger") as mock_logger:
+            _drain_bridge_output(stream)
+
+        logged = [call.kwargs["line"] for call in mock_logger.debug.call_args_list]
+        assert logged == ["[PGlite Bridge] starting", "[PGlite Bridge] ready", "partial"]
+        assert stream.closed
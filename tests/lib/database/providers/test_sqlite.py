@@ -72,6 +72,24 @@ class TestSQLiteBackend:
         # Should use default path
         assert "automagik-hive.db" in backend.db_path
 
+    @pytest.mark.asyncio
+    async def test_file_database_uses_wal(self, mock_aiosqlite, mock_os_makedirs):
+        """Test file databases switch to WAL while in-memory databases keep the default journal."""
+        backend = SQLiteBackend(db_url="sqlite:///data/test.db")
+        async with backend.get_connection():
+            pass
+
+        script = mock_aiosqlite.executescript.call_args[0][0]
+        assert "PRAGMA journal_mode = WAL;" in script
+        assert "PRAGMA synchronous = NORMAL;" in script
+
+        mock_aiosqlite.executescript.reset_mock()
+        memory_backend = SQLiteBackend(db_url="sqlite:///:memory:")
+        async with memory_backend.get_connection():
+            pass
+
+        mock_aiosqlite.executescript.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_execute_query(self, mock_aiosqlite, mock_os_makedirs):
         """Test query execution without results."""
@@ -18,6 +18,19 @@ class TestConfig:
 
         assert lib.logging.config is not None
 
+    def test_setup_logging_reuses_root_handler(self):
+        """Test repeated setup keeps exactly one shared handler on the root logger."""
+        import logging
+
+        import lib.logging.config
+
+        lib.logging.config.setup_logging()
+        first = lib.logging.config._emoji_handler
+        lib.logging.config.setup_logging()
+
+        assert lib.logging.config._emoji_handler is first
+        assert logging.getLogger().handlers == [first]
+
     @pytest.mark.skip(reason="Placeholder test - implement based on actual module functionality")
     def test_placeholder_functionality(self):
         """Placeholder test for main functionality."""
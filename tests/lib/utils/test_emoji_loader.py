@@ -198,6 +198,29 @@ class TestEmojiLoaderComprehensive:
             else:
                 assert result == ""
 
+    def test_emoji_loader_match_priority(self, temp_directory):
+        """Test longest directory and keyword win, then the file extension applies."""
+        from lib.utils.emoji_loader import EmojiLoader
+
+        config_file = temp_directory / "emoji_config.yaml"
+        config = {
+            "resource_types": {
+                "directories": {"lib/": "📚", "lib/auth/": "🔐"},
+                "activities": {"start": "🚀"},
+                "services": {"database": "🗄️", "database migration": "🔄"},
+                "file_types": {".md": "📝"},
+            }
+        }
+        with open(config_file, "w") as f:
+            yaml.dump(config, f)
+
+        loader = EmojiLoader(str(config_file))
+
+        assert loader.get_emoji("lib/auth/service.py", "") == "🔐"
+        assert loader.get_emoji("", "start database migration") == "🔄"
+        assert loader.get_emoji("", "start database") == "🗄️"
+        assert loader.get_emoji("docs/readme.md", "nothing here") == "📝"
+
     def test_emoji_loader_config_path_resolution(self):
         """Test config path resolution."""
         from lib.utils.emoji_loader import EmojiLoader
@@ -0,0 +1,39 @@
+"""Tests for lib.utils.fallback_model module."""
+
+from lib.utils.fallback_model import FallbackModel
+
+
+class TestFallbackModelFormatting:
+    """Test FallbackModel error message formatting."""
+
+    def test_format_error_message_with_suggestion(self):
+        """Test formatted message includes suggestion block when provided."""
+        model = FallbackModel(
+            {"error": "invalid_api_key", "message": "Key rejected", "suggestion": "Rotate the key"},
+            component_id="template-agent",
+        )
+
+        assert model.invoke("ignored") == (
+            "❌ **Invalid Api Key**\n\n"
+            "Key rejected\n"
+            "\n💡 **Suggestion**: Rotate the key\n"
+            "\n🤖 **Component**: template-agent\n"
+            "🔧 **Status**: Using fallback mode to prevent crashes\n"
+        )
+
+    def test_format_error_message_without_suggestion(self):
+        """Test formatted message omits suggestion block and uses defaults."""
+        model = FallbackModel({}, component_id="template-agent")
+
+        assert model.invoke("ignored") == (
+            "❌ **Unknown Error**\n\n"
+            "An unknown error occurred\n"
+            "\n🤖 **Component**: template-agent\n"
+            "🔧 **Status**: Using fallback mode to prevent crashes\n"
+        )
+
+    def test_stream_chunks_reassemble_to_message(self):
+        """Test streamed chunks reassemble into the full formatted message."""
+        model = FallbackModel({"message": "Boom"}, component_id="agent")
+
+        assert "".join(model.stream("ignored")) == model.invoke("ignored")
@@ -11,6 +11,7 @@ This module tests all core functionality including:
 - Complete startup orchestration
 """
 
+import asyncio
 import os
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
@@ -513,6 +514,35 @@ class TestOrchestratedStartup:
             mock_sync.assert_called_once_with(mock_registries, "test_db_url")
             mock_services_init.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_orchestrated_startup_overlaps_knowledge_with_discovery(self):
+        """Test knowledge base loading runs alongside component discovery."""
+        mock_registries = Mock()
+        mock_registries.total_components = 1
+        mock_csv_manager = Mock()
+        discovery_started = asyncio.Event()
+
+        async def slow_knowledge_base():
+            # Only completes once discovery is underway; sequential startup would hang here
+            await discovery_started.wait()
+            return mock_csv_manager
+
+        async def discovery():
+            discovery_started.set()
+            return mock_registries
+
+        with (
+            patch("lib.utils.db_migration.check_and_run_migrations", return_value=False),
+            patch("lib.utils.startup_orchestration.initialize_knowledge_base", side_effect=slow_knowledge_base),
+            patch("lib.utils.startup_orchestration.batch_component_discovery", side_effect=discovery),
+            patch("lib.utils.startup_orchestration.run_version_synchronization", return_value=None),
+            patch("lib.utils.startup_orchestration.initialize_other_services", return_value=Mock()) as mock_services,
+        ):
+            result = await asyncio.wait_for(orchestrated_startup(), timeout=1)
+
+            assert result.registries == mock_registries
+            mock_services.assert_called_once_with(mock_csv_manager)
+
     @pytest.mark.asyncio
     async def test_orchestrated_startup_quiet_mode(self):
         """Test orchestrated startup in quiet mode."""
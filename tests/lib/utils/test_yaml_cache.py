@@ -77,6 +77,13 @@ class TestYAMLCacheManager:
         assert len(cache._glob_cache) == 0
         assert isinstance(cache._lock, type(threading.RLock()))
 
+    def test_yaml_loader_prefers_libyaml(self):
+        """Test the cache parses with the C loader when libyaml is available."""
+        from lib.utils import yaml_cache
+
+        expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        assert yaml_cache._YAML_LOADER is expected
+
     def test_load_yaml_file_not_exists(self):
         """Test loading non-existent YAML file returns None."""
         result = self.cache.get_yaml("/non/existent/file.yaml")
@@ -377,6 +384,19 @@ class TestYAMLCacheManager:
         assert stats_after_clear["yaml_cache_entries"] == 0
         assert stats_after_clear["yaml_cache_size_bytes"] == 0
 
+    def test_manage_cache_size_evicts_oldest_entries(self):
+        """Test cache trimming drops the oldest entries by mtime."""
+        cache = YAMLCacheManager(max_cache_size=10)
+        for i in range(11):
+            key = f"/test/file_{i}.yaml"
+            cache._yaml_cache[key] = CachedYAML({"index": i}, float(100 - i), key, 10)
+
+        cache._manage_cache_size()
+
+        assert len(cache._yaml_cache) == 10
+        assert "/test/file_10.yaml" not in cache._yaml_cache
+        assert "/test/file_0.yaml" in cache._yaml_cache
+
 
 class TestYAMLCacheIntegration:
     """Integration tests using real files."""